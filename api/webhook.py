@@ -1,9 +1,8 @@
 from http.server import BaseHTTPRequestHandler
+from functools import lru_cache
+import asyncio
 import json
 import os
-from telegram import Update
-from telegram.ext import Application, CommandHandler
-from telegram_bot import start, help_command, status, settings, trade
 import logging
 
 # Enable logging
@@ -12,21 +11,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Event loop reused by every update handled while the container stays warm
+_LOOP = asyncio.new_event_loop()
+
+@lru_cache(maxsize=None)
+def _get_app():
+    """Build the Telegram application once; warm requests reuse it."""
+    # Heavy imports are deferred to the first request that needs them
+    from telegram.ext import Application, CommandHandler
+    from telegram_bot import start, help_command, status, settings, trade
+
+    TOKEN = os.getenv('TELEGRAM_TOKEN')
+    if not TOKEN:
+        raise ValueError("TELEGRAM_TOKEN not found in environment variables")
+
+    app = Application.builder().token(TOKEN).build()
+
+    # Add handlers
+    app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("help", help_command))
+    app.add_handler(CommandHandler("status", status))
+    app.add_handler(CommandHandler("settings", settings))
+    app.add_handler(CommandHandler("trade", trade))
+    return app
+
 async def process_update(update_data):
     """Process Telegram update data."""
     try:
-        TOKEN = os.getenv('TELEGRAM_TOKEN')
-        if not TOKEN:
-            raise ValueError("TELEGRAM_TOKEN not found in environment variables")
+        from telegram import Update
 
-        app = Application.builder().token(TOKEN).build()
-        
-        # Add handlers
-        app.add_handler(CommandHandler("start", start))
-        app.add_handler(CommandHandler("help", help_command))
-        app.add_handler(CommandHandler("status", status))
-        app.add_handler(CommandHandler("settings", settings))
-        app.add_handler(CommandHandler("trade", trade))
+        app = _get_app()
+        await app.initialize()  # No-op once the application is initialized
 
         # Process update
         update = Update.de_json(update_data, app.bot)
@@ -37,30 +52,6 @@ async def process_update(update_data):
         logger.error(f"Error processing webhook: {str(e)}")
         return {"statusCode": 500, "body": str(e)}
 
-def handler(event, context):
-    """Serverless function handler for Vercel."""
-    try:
-        # Parse the incoming request body
-        if isinstance(event.get('body'), str):
-            update_data = json.loads(event['body'])
-        else:
-            update_data = event.get('body', {})
-
-        # Process the update
-        import asyncio
-        result = asyncio.run(process_update(update_data))
-        
-        return {
-            'statusCode': result.get('statusCode', 200),
-            'body': json.dumps(result)
-        }
-    except Exception as e:
-        logger.error(f"Error in handler: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({"error": str(e)})
-        }
-
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
         """Handle POST requests from Telegram."""
@@ -68,10 +59,14 @@ class handler(BaseHTTPRequestHandler):
         post_data = self.rfile.read(content_length)
         
         # Process the webhook
-        result = webhook_handler(json.loads(post_data))
+        result = _LOOP.run_until_complete(process_update(json.loads(post_data)))
+        
+        # Serialize once, without the default separator whitespace
+        payload = json.dumps(result, separators=(',', ':')).encode()
         
         # Send response
         self.send_response(result.get('statusCode', 200))
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
         self.end_headers()
-        self.wfile.write(json.dumps(result).encode()) 
\ No newline at end of file
+        self.wfile.write(payload)
@@ -1,19 +1,51 @@
 from backtesting import Backtest, Strategy
 import pandas as pd
 import numpy as np
+from typing import Tuple
 from strategies.advanced_strategy import advanced_strategy
+from utils.indicator_cache import IndicatorCache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Noms de colonnes attendus par backtesting.py
+_RENAME = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume',
+    'timestamp': 'Timestamp'
+}
+
+# Signaux partagés entre les exécutions successives de Backtest.run()
+_signal_cache = IndicatorCache(maxsize=512)
+
+def cached_signals(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retourne les signaux de advanced_strategy, calculés une seule fois par jeu de données.
+    
+    Args:
+        df (pd.DataFrame): Données OHLCV au format backtesting.py (colonnes capitalisées)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Signaux d'achat et de vente
+    """
+    def compute():
+        return advanced_strategy(df.rename(columns=str.lower))
+    
+    key = IndicatorCache.fingerprint(df, ('Close',))
+    return _signal_cache.get_or_compute(key, compute)
+
 class AdvancedTradingStrategy(Strategy):
     """
     Stratégie de trading avancée utilisant EMA, RSI et MACD.
     """
     def init(self):
         # Initialisation des indicateurs
-        self.df = self.data.df
-        self.buy_signal, self.sell_signal = advanced_strategy(self.df)
+        buy_signal, sell_signal = cached_signals(self.data.df)
+        self.buy_signal = self.I(lambda: buy_signal, name='buy_signal', plot=False)
+        self.sell_signal = self.I(lambda: sell_signal, name='sell_signal', plot=False)
         
         # Paramètres de la stratégie
         self.stop_loss = 0.02  # 2% de stop loss
@@ -23,33 +55,33 @@ class AdvancedTradingStrategy(Strategy):
 
     def next(self):
         # Vérification des conditions d'achat
-        if self.buy_signal.iloc[-1] and not self.position:
+        if self.buy_signal[-1] and not self.position:
             # Calcul de la taille de la position
             price = self.data.Close[-1]
             size = self.equity * 0.95 / price  # Utilise 95% du capital disponible
             
             # Entrée dans la position
             self.buy(size=size)
-            logger.info(f"Signal d'achat détecté à {price}")
+            logger.info("Signal d'achat détecté à %s", price)
             
             # Définition du stop loss et take profit
             self.position.stop_loss = price * (1 - self.stop_loss)
             self.position.take_profit = price * (1 + self.take_profit)
         
         # Vérification des conditions de vente
-        elif self.sell_signal.iloc[-1] and self.position:
+        elif self.sell_signal[-1] and self.position:
             self.position.close()
-            logger.info(f"Signal de vente détecté à {self.data.Close[-1]}")
+            logger.info("Signal de vente détecté à %s", self.data.Close[-1])
         
         # Vérification du stop loss et take profit
         elif self.position:
             current_price = self.data.Close[-1]
             if current_price <= self.position.stop_loss:
                 self.position.close()
-                logger.info(f"Stop loss atteint à {current_price}")
+                logger.info("Stop loss atteint à %s", current_price)
             elif current_price >= self.position.take_profit:
                 self.position.close()
-                logger.info(f"Take profit atteint à {current_price}")
+                logger.info("Take profit atteint à %s", current_price)
 
 def run_backtest(df: pd.DataFrame, initial_cash: float = 10000, commission: float = 0.002) -> dict:
     """
@@ -64,9 +96,10 @@ def run_backtest(df: pd.DataFrame, initial_cash: float = 10000, commission: floa
         dict: Résultats du backtesting
     """
     try:
-        # Préparation des données
-        df = df.copy()
-        df.columns = [col.capitalize() for col in df.columns]
+        # Préparation des données: renommage sans copie des colonnes OHLCV
+        # (copy-on-write), ignoré si les colonnes sont déjà au bon format
+        if 'Close' not in df.columns:
+            df = df.rename(columns=_RENAME)
         
         # Création et exécution du backtest
         bt = Backtest(
@@ -81,7 +114,7 @@ def run_backtest(df: pd.DataFrame, initial_cash: float = 10000, commission: floa
         results = bt.run()
         
         # Affichage des résultats
-        logger.info(f"Résultats du backtesting:\n{results}")
+        logger.info("Résultats du backtesting:\n%s", results)
         
         # Plot des résultats
         bt.plot()
@@ -89,5 +122,5 @@ def run_backtest(df: pd.DataFrame, initial_cash: float = 10000, commission: floa
         return results
         
     except Exception as e:
-        logger.error(f"Erreur lors du backtesting: {str(e)}")
+        logger.error("Erreur lors du backtesting: %s", e)
         raise 
\ No newline at end of file
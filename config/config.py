@@ -1,37 +1,67 @@
 import os
+import sys
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Chargement des variables d'environnement
 load_dotenv()
 
+# slots=True n'existe qu'à partir de Python 3.10 (le runtime Vercel est en 3.9)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _parse_bool(name: str, default: str) -> bool:
+    """Lit une variable d'environnement booléenne ('true'/'false')."""
+    return os.getenv(name, default).lower() == 'true'
+
+@dataclass(frozen=True, **_SLOTS)
+class BinanceConfig:
+    api_key: Optional[str]
+    api_secret: Optional[str]
+    testnet: bool
+
+@dataclass(frozen=True, **_SLOTS)
+class TelegramConfig:
+    bot_token: Optional[str]
+    chat_id: Optional[str]
+    use_telegram: bool
+
+@dataclass(frozen=True, **_SLOTS)
+class TradingConfig:
+    default_symbol: str = 'BTCUSDT'
+    default_interval: str = '1h'
+    default_limit: int = 100
+    max_trades_per_day: int = 5
+    risk_percentage: float = 1.0  # Pourcentage du portfolio à risquer par trade
+    stop_loss_percentage: float = 2.0  # Pourcentage de stop loss
+    take_profit_percentage: float = 3.0  # Pourcentage de take profit
+
+@dataclass(frozen=True, **_SLOTS)
+class CloudConfig:
+    provider: str
+    instance_type: str
+    region: str
+
 # Configuration Binance
-BINANCE_CONFIG = {
-    'api_key': os.getenv('BINANCE_API_KEY'),
-    'api_secret': os.getenv('BINANCE_API_SECRET'),
-    'testnet': os.getenv('USE_TESTNET', 'False').lower() == 'true'
-}
+BINANCE_CONFIG = BinanceConfig(
+    api_key=os.getenv('BINANCE_API_KEY'),
+    api_secret=os.getenv('BINANCE_API_SECRET'),
+    testnet=_parse_bool('USE_TESTNET', 'False')
+)
 
 # Configuration Telegram
-TELEGRAM_CONFIG = {
-    'bot_token': os.getenv('TELEGRAM_BOT_TOKEN'),
-    'chat_id': os.getenv('TELEGRAM_CHAT_ID'),
-    'use_telegram': os.getenv('USE_TELEGRAM', 'True').lower() == 'true'
-}
+TELEGRAM_CONFIG = TelegramConfig(
+    bot_token=os.getenv('TELEGRAM_BOT_TOKEN'),
+    chat_id=os.getenv('TELEGRAM_CHAT_ID'),
+    use_telegram=_parse_bool('USE_TELEGRAM', 'True')
+)
 
 # Configuration Trading
-TRADING_CONFIG = {
-    'default_symbol': 'BTCUSDT',
-    'default_interval': '1h',
-    'default_limit': 100,
-    'max_trades_per_day': 5,
-    'risk_percentage': 1.0,  # Pourcentage du portfolio à risquer par trade
-    'stop_loss_percentage': 2.0,  # Pourcentage de stop loss
-    'take_profit_percentage': 3.0  # Pourcentage de take profit
-}
+TRADING_CONFIG = TradingConfig()
 
 # Configuration Cloud
-CLOUD_CONFIG = {
-    'provider': os.getenv('CLOUD_PROVIDER', 'clouding'),
-    'instance_type': os.getenv('INSTANCE_TYPE', 'small'),
-    'region': os.getenv('CLOUD_REGION', 'eu-west-1')
-} 
\ No newline at end of file
+CLOUD_CONFIG = CloudConfig(
+    provider=os.getenv('CLOUD_PROVIDER', 'clouding'),
+    instance_type=os.getenv('INSTANCE_TYPE', 'small'),
+    region=os.getenv('CLOUD_REGION', 'eu-west-1')
+)
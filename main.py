@@ -35,10 +35,20 @@ class CryptoBot:
                 interval=interval,
                 limit=limit
             )
-            return pd.DataFrame(klines, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume',
-                                               'close_time', 'quote_asset_volume', 'number_of_trades',
-                                               'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume',
-                                               'ignore'])
+            # Conversion typée en une passe: colonnes float64/int64 au lieu d'objets str
+            arr = np.asarray(klines, dtype=object).reshape(-1, 12)
+            return pd.DataFrame({
+                'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+                'open': arr[:, 1].astype(np.float64),
+                'high': arr[:, 2].astype(np.float64),
+                'low': arr[:, 3].astype(np.float64),
+                'close': arr[:, 4].astype(np.float64),
+                'volume': arr[:, 5].astype(np.float64),
+                'quote_asset_volume': arr[:, 7].astype(np.float64),
+                'number_of_trades': arr[:, 8].astype(np.int64),
+                'taker_buy_base_asset_volume': arr[:, 9].astype(np.float64),
+                'taker_buy_quote_asset_volume': arr[:, 10].astype(np.float64)
+            })
         except Exception as e:
             print(f"Erreur lors de la récupération des données du marché: {e}")
             return None
@@ -2,11 +2,14 @@ import os
 import logging
 import pandas as pd
 import numpy as np
+import orjson
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Tuple
+from typing import Dict, Any
+import optuna
 from utils.advanced_strategy import AdvancedStrategy
 from utils.risk_manager import RiskManager
-from utils.optimization_manager import OptimizationManager
+from utils.backtest_kernels import simulate
 
 # Configuration du logging
 logging.basicConfig(
@@ -28,25 +31,40 @@ class EnhancedBacktest:
         """
         self.risk_percentage = risk_percentage
         self.risk_manager = RiskManager()
-        self.optimization_manager = OptimizationManager(None, self.risk_manager)
         
     def load_data(self, file_path: str) -> pd.DataFrame:
         """
         Charge les données historiques.
         
+        Le CSV est analysé une fois avec le moteur pyarrow, puis converti en
+        Parquet à côté du fichier source: les chargements suivants lisent
+        directement le Parquet tant que le CSV n'a pas été modifié.
+        
         Args:
-            file_path (str): Chemin du fichier CSV
+            file_path (str): Chemin du fichier CSV (ou Parquet)
             
         Returns:
             pd.DataFrame: Données historiques
         """
         try:
-            df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.set_index('timestamp', inplace=True)
+            path = Path(file_path)
+            if path.suffix == '.parquet':
+                return pd.read_parquet(path)
+            
+            cache_path = path.with_suffix('.parquet')
+            if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+                return pd.read_parquet(cache_path)
+            
+            df = pd.read_csv(path, engine='pyarrow', parse_dates=['timestamp']).set_index('timestamp')
+            
+            try:
+                df.to_parquet(cache_path, compression='zstd')
+            except OSError as e:
+                logger.warning("Impossible d'écrire le cache Parquet %s: %s", cache_path, e)
+            
             return df
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des données: {str(e)}")
+            logger.error("Erreur lors du chargement des données: %s", e)
             raise
             
     def calculate_metrics(self, trades: pd.DataFrame) -> Dict[str, float]:
@@ -60,18 +78,30 @@ class EnhancedBacktest:
             Dict[str, float]: Métriques de performance
         """
         try:
-            # Calcul des retours
-            returns = trades['pnl'].pct_change()
+            # Une seule passe NumPy, masques calculés une fois
+            pnl = trades['pnl'].to_numpy()
+            equity = trades['equity'].to_numpy()
+            winning = pnl > 0
+            losing = pnl < 0
+            
+            # Calcul des retours sur la courbe d'equity
+            returns = np.diff(equity) / equity[:-1]
+            returns_std = np.std(returns, ddof=1) if len(returns) > 1 else 0
             
             # Métriques de base
-            total_return = (trades['pnl'].iloc[-1] / trades['initial_capital'].iloc[0]) - 1
-            sharpe_ratio = np.sqrt(252) * returns.mean() / returns.std() if returns.std() != 0 else 0
-            max_drawdown = (trades['equity'].cummax() - trades['equity']) / trades['equity'].cummax()
-            max_drawdown = max_drawdown.max()
+            total_return = (equity[-1] / trades.attrs['initial_capital']) - 1
+            sharpe_ratio = np.sqrt(252) * np.mean(returns) / returns_std if returns_std != 0 else 0
+            
+            # Drawdown: un tampon pour les pics, un pour l'écart divisé sur place
+            peak = np.maximum.accumulate(equity)
+            drawdown = np.subtract(peak, equity)
+            np.divide(drawdown, peak, out=drawdown, where=peak != 0)
+            max_drawdown = drawdown.max()
             
             # Métriques de trading
-            win_rate = len(trades[trades['pnl'] > 0]) / len(trades)
-            profit_factor = abs(trades[trades['pnl'] > 0]['pnl'].sum() / trades[trades['pnl'] < 0]['pnl'].sum())
+            win_rate = winning.mean()
+            gross_loss = -pnl[losing].sum()
+            profit_factor = pnl[winning].sum() / gross_loss if gross_loss != 0 else np.inf
             
             return {
                 'total_return': total_return,
@@ -80,12 +110,12 @@ class EnhancedBacktest:
                 'win_rate': win_rate,
                 'profit_factor': profit_factor,
                 'total_trades': len(trades),
-                'avg_trade': trades['pnl'].mean(),
-                'std_trade': trades['pnl'].std()
+                'avg_trade': pnl.mean(),
+                'std_trade': np.std(pnl, ddof=1)
             }
             
         except Exception as e:
-            logger.error(f"Erreur lors du calcul des métriques: {str(e)}")
+            logger.error("Erreur lors du calcul des métriques: %s", e)
             raise
             
     def run_backtest(self, data: pd.DataFrame, strategy: AdvancedStrategy) -> pd.DataFrame:
@@ -100,14 +130,7 @@ class EnhancedBacktest:
             pd.DataFrame: Historique des trades
         """
         try:
-            # Initialisation
-            trades = pd.DataFrame()
-            position = 0
-            entry_price = 0
-            stop_loss = 0
-            equity = 10000  # Capital initial
-            trades['equity'] = equity
-            trades['initial_capital'] = equity
+            equity = 10000.0  # Capital initial
             
             # Calcul des indicateurs
             df = strategy.calculate_indicators(data.copy())
@@ -119,87 +142,91 @@ class EnhancedBacktest:
             win_rate = 0.65  # À remplacer par des statistiques réelles
             win_loss_ratio = 2.5  # À remplacer par des statistiques réelles
             
-            # Simulation des trades
-            for i in range(len(df)):
-                current_price = df['close'].iloc[i]
-                
-                # Gestion des positions existantes
-                if position > 0:
-                    # Vérification du stop-loss
-                    if current_price <= stop_loss:
-                        pnl = (current_price - entry_price) * position
-                        equity += pnl
-                        position = 0
-                        trades.loc[df.index[i]] = {
-                            'type': 'sell',
-                            'price': current_price,
-                            'pnl': pnl,
-                            'equity': equity,
-                            'initial_capital': trades['initial_capital'].iloc[0]
-                        }
-                
-                # Entrée en position
-                elif buy_signals.iloc[i]:
-                    # Calcul de la taille de position avec le critère de Kelly
-                    atr = df['ATR'].iloc[i]
-                    stop_loss = stop_losses.iloc[i]
-                    
-                    # Analyse du setup avec le critère de Kelly
-                    stop_loss, take_profit, position_size = self.risk_manager.analyze_trade_setup(
-                        current_price,
-                        atr,
-                        equity,
-                        win_rate,
-                        win_loss_ratio
-                    )
-                    
-                    position = position_size
-                    entry_price = current_price
-                    trades.loc[df.index[i]] = {
-                        'type': 'buy',
-                        'price': current_price,
-                        'pnl': 0,
-                        'equity': equity,
-                        'initial_capital': trades['initial_capital'].iloc[0],
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'position_size': position_size
-                    }
+            # Simulation des trades (kernel compilé par Numba si disponible)
+            idx, is_exit, price, pnl, equity_curve, stop_loss, take_profit, size = simulate(
+                df['close'].to_numpy(dtype=np.float64),
+                df['ATR'].to_numpy(dtype=np.float64),
+                np.flatnonzero(buy_signals.to_numpy(dtype=np.bool_)),
+                equity,
+                2.0,  # Multiplicateur ATR de calculate_dynamic_stop_loss
+                2.0,  # Ratio risque/récompense de calculate_take_profit
+                self.risk_manager.kelly_criterion(win_rate, win_loss_ratio)
+            )
+            
+            # Construction de l'historique en une seule allocation
+            trades = pd.DataFrame({
+                'type': np.where(is_exit, 'sell', 'buy'),
+                'price': price,
+                'pnl': pnl,
+                'equity': equity_curve,
+                'stop_loss': stop_loss,
+                'take_profit': take_profit,
+                'position_size': size
+            }, index=df.index[idx])
+            trades.attrs['initial_capital'] = equity
             
             return trades
             
         except Exception as e:
-            logger.error(f"Erreur lors du backtest: {str(e)}")
+            logger.error("Erreur lors du backtest: %s", e)
             raise
             
-    def optimize_strategy(self, data: pd.DataFrame, param_grid: Dict[str, Any]) -> Dict[str, Any]:
+    def optimize_strategy(self, data: pd.DataFrame, param_grid: Dict[str, Any],
+                          n_trials: int = 300, n_jobs: int = 1) -> Dict[str, Any]:
         """
-        Optimise les paramètres de la stratégie.
+        Optimise les paramètres de la stratégie par recherche bayésienne (TPE).
+        
+        La grille complète compte plusieurs millions de combinaisons; l'échantillonneur
+        TPE d'Optuna converge en quelques centaines d'essais sur le même espace.
         
         Args:
             data (pd.DataFrame): Données historiques
-            param_grid (Dict[str, Any]): Grille de paramètres
+            param_grid (Dict[str, Any]): Espace de recherche (range ou liste par paramètre)
+            n_trials (int): Nombre d'essais
+            n_jobs (int): Nombre d'essais évalués en parallèle. Optuna utilise des
+                threads: au-delà de 1, le gain est limité tant que le backtest
+                garde le GIL (boucles Python, kernels Numba sans nogil)
             
         Returns:
-            Dict[str, Any]: Meilleurs paramètres et résultats
+            Dict[str, Any]: Meilleurs paramètres et résultats (paramètres vides,
+            donc ceux par défaut de la stratégie, si aucun essai n'a abouti)
         """
+        def suggest(trial: optuna.Trial, name: str, values: Any) -> Any:
+            if isinstance(values, range):
+                return trial.suggest_int(name, values.start, values[-1], step=values.step)
+            return trial.suggest_categorical(name, list(values))
+        
+        def objective(trial: optuna.Trial) -> float:
+            params = {name: suggest(trial, name, values) for name, values in param_grid.items()}
+            trades = self.run_backtest(data, AdvancedStrategy(**params))
+            if len(trades) < 2:
+                raise optuna.TrialPruned()
+            return self.calculate_metrics(trades)['sharpe_ratio']
+        
         try:
-            # Création de la stratégie de base
-            base_strategy = AdvancedStrategy()
-            
-            # Optimisation
-            results = self.optimization_manager.optimize_parameters(
-                'BTCUSDT',  # Symbole fictif pour l'optimisation
-                base_strategy,
-                param_grid,
-                data.index[0],
-                data.index[-1]
-            )
+            study = optuna.create_study(direction='maximize', sampler=optuna.samplers.TPESampler())
+            study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs)
             
-            return results
+            # Tous les essais élagués (moins de 2 trades): paramètres par défaut
+            completed = study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,))
+            if not completed:
+                logger.warning("Aucun essai abouti sur %d, paramètres par défaut conservés", len(study.trials))
+                return {
+                    'best_params': {},
+                    'best_score': -np.inf,
+                    'n_evaluated': len(study.trials)
+                }
+            
+            logger.info("%d essais évalués, meilleur Sharpe: %.4f", len(study.trials), study.best_value)
+            
+            return {
+                'best_params': study.best_params,
+                'best_score': study.best_value,
+                'n_evaluated': len(study.trials)
+            }
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'optimisation: {str(e)}")
+            logger.error("Erreur lors de l'optimisation: %s", e)
             raise
             
     def generate_report(self, trades: pd.DataFrame, metrics: Dict[str, float]) -> Dict[str, Any]:
@@ -225,14 +252,15 @@ class EnhancedBacktest:
                     'winning_trades': len(trades[trades['pnl'] > 0]),
                     'losing_trades': len(trades[trades['pnl'] < 0])
                 },
-                'equity_curve': trades['equity'].tolist(),
-                'dates': trades.index.strftime('%Y-%m-%d %H:%M:%S').tolist()
+                'equity_curve': trades['equity'].to_numpy(),
+                # datetime64 sérialisé en ISO 8601 directement par orjson
+                'dates': trades.index.to_numpy().astype('datetime64[s]')
             }
             
             return report
             
         except Exception as e:
-            logger.error(f"Erreur lors de la génération du rapport: {str(e)}")
+            logger.error("Erreur lors de la génération du rapport: %s", e)
             raise
 
 def main():
@@ -245,13 +273,14 @@ def main():
         parser = argparse.ArgumentParser(description='Backtest avec optimisation et gestion des risques')
         parser.add_argument('--data', type=str, required=True, help='Chemin du fichier de données historiques')
         parser.add_argument('--risk', type=float, default=3.0, help='Pourcentage de risque par trade')
+        parser.add_argument('--trials', type=int, default=300, help="Nombre d'essais de l'optimisation bayésienne")
         args = parser.parse_args()
         
         # Initialisation
         backtest = EnhancedBacktest(risk_percentage=args.risk)
         
         # Chargement des données
-        logger.info(f"Chargement des données depuis {args.data}")
+        logger.info("Chargement des données depuis %s", args.data)
         data = backtest.load_data(args.data)
         
         # Création de la stratégie
@@ -274,7 +303,7 @@ def main():
             'bb_std': [1.5, 2.0, 2.5, 3.0]
         }
         
-        optimization_results = backtest.optimize_strategy(data, param_grid)
+        optimization_results = backtest.optimize_strategy(data, param_grid, n_trials=args.trials)
         
         # Mise à jour de la stratégie avec les meilleurs paramètres
         strategy.set_params(**optimization_results['best_params'])
@@ -295,10 +324,10 @@ def main():
         
         # Sauvegarde du rapport
         report_file = os.path.join(results_dir, f'backtest_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=4)
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
-        logger.info(f"Rapport sauvegardé dans {report_file}")
+        logger.info("Rapport sauvegardé dans %s", report_file)
         
         # Affichage des résultats
         print("\nRésultats du backtest:")
@@ -310,7 +339,7 @@ def main():
         print(f"Nombre total de trades: {metrics['total_trades']}")
         
     except Exception as e:
-        logger.error(f"Erreur lors de l'exécution: {str(e)}")
+        logger.error("Erreur lors de l'exécution: %s", e)
         raise
 
 if __name__ == "__main__":
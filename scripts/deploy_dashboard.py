@@ -1,20 +1,366 @@
 import os
-import json
+import copy
+import gzip
+import hashlib
+import sqlite3
+import orjson
+import tempfile
+import threading
+import time
 import logging
-import requests
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from urllib.parse import quote
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Timeout (connexion, lecture) des appels à l'API Grafana
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Dashboard construit une seule fois à l'import; les panels référencent la
+# source de données par défaut, remplacée à la volée pour un autre nom
+DEFAULT_DATASOURCE = "trading_metrics"
+
+# Nombre maximal de dashboards envoyés simultanément à Grafana
+DEPLOY_CONCURRENCY = int(os.getenv('GRAFANA_DEPLOY_CONCURRENCY', '10'))
+
+# Cache local des déploiements réussis
+DEFAULT_CACHE_PATH = "~/.cache/cryptoia/deploy.db"
+
+# Umask du processus, lu une fois à l'import (os.umask n'a pas de lecture seule)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Requêtes Flux sur une ligne, sans indentation superflue dans le JSON envoyé
+_FLUX_QUERIES: Dict[str, str] = {
+    'daily_return': 'from(bucket:"trading_metrics")|>range(start:-7d)|>filter(fn:(r)=>r["_measurement"]=="daily_return")|>yield(name:"mean")',
+    'win_rate': 'from(bucket:"trading_metrics")|>range(start:-1h)|>filter(fn:(r)=>r["_measurement"]=="win_rate")|>last()',
+    'drawdown': 'from(bucket:"trading_metrics")|>range(start:-7d)|>filter(fn:(r)=>r["_measurement"]=="risk_metrics")|>filter(fn:(r)=>r["_field"]=="drawdown")',
+    'volatility': 'from(bucket:"trading_metrics")|>range(start:-7d)|>filter(fn:(r)=>r["_measurement"]=="risk_metrics")|>filter(fn:(r)=>r["_field"]=="volatility")',
+    'trading_volume': 'from(bucket:"trading_metrics")|>range(start:-7d)|>filter(fn:(r)=>r["_measurement"]=="trading_volume")|>yield(name:"mean")'
+}
+
+# Blocs partagés par les panels de séries temporelles (jamais modifiés:
+# _dashboard() travaille sur une copie profonde)
+_TIMESERIES_CUSTOM: Dict[str, Any] = {
+    "axisCenteredZero": False,
+    "axisColorMode": "text",
+    "axisLabel": "",
+    "axisPlacement": "auto",
+    "barAlignment": 0,
+    "drawStyle": "line",
+    "fillOpacity": 10,
+    "gradientMode": "none",
+    "hideFrom": {
+        "legend": False,
+        "tooltip": False,
+        "viz": False
+    },
+    "lineInterpolation": "linear",
+    "lineWidth": 1,
+    "pointSize": 5,
+    "scaleDistribution": {
+        "type": "linear"
+    },
+    "showPoints": "auto",
+    "spanNulls": False,
+    "stacking": {
+        "group": "A",
+        "mode": "none"
+    },
+    "thresholdsStyle": {
+        "mode": "off"
+    }
+}
+
+_POSITIVE_THRESHOLDS: Dict[str, Any] = {
+    "mode": "absolute",
+    "steps": [
+        {"color": "red", "value": None},
+        {"color": "green", "value": 0}
+    ]
+}
+
+def _panel(panel_id: int, title: str, panel_type: str, x: int, y: int,
+           targets: List[Dict[str, Any]], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Construit un panel 12x8 du dashboard.
+    
+    Args:
+        panel_id (int): Identifiant du panel
+        title (str): Titre du panel
+        panel_type (str): Type de visualisation Grafana
+        x (int): Position horizontale
+        y (int): Position verticale
+        targets (List[Dict[str, Any]]): Requêtes Flux du panel
+        defaults (Dict[str, Any]): fieldConfig.defaults du panel
+        
+    Returns:
+        Dict[str, Any]: Définition du panel
+    """
+    return {
+        "id": panel_id,
+        "title": title,
+        "type": panel_type,
+        "datasource": DEFAULT_DATASOURCE,
+        "gridPos": {"h": 8, "w": 12, "x": x, "y": y},
+        "targets": targets,
+        "fieldConfig": {"defaults": defaults}
+    }
+
+def _timeseries_panel(panel_id: int, title: str, x: int, y: int,
+                      targets: List[Dict[str, Any]], thresholds: Dict[str, Any],
+                      unit: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Construit un panel de séries temporelles partageant le style commun.
+    
+    Args:
+        panel_id (int): Identifiant du panel
+        title (str): Titre du panel
+        x (int): Position horizontale
+        y (int): Position verticale
+        targets (List[Dict[str, Any]]): Requêtes Flux du panel
+        thresholds (Dict[str, Any]): Seuils de couleur
+        unit (Optional[str]): Unité des valeurs
+        
+    Returns:
+        Dict[str, Any]: Définition du panel
+    """
+    defaults = {
+        "color": {"mode": "palette-classic"},
+        "custom": _TIMESERIES_CUSTOM,
+        "mappings": [],
+        "thresholds": thresholds
+    }
+    if unit is not None:
+        defaults["unit"] = unit
+    return _panel(panel_id, title, "timeseries", x, y, targets, defaults)
+
+_DASHBOARD_TEMPLATE: Dict[str, Any] = {
+    "id": None,
+    "uid": "trading-bot-dashboard",
+    "title": "Trading Bot Dashboard",
+    "tags": ["trading", "crypto"],
+    "timezone": "browser",
+    "schemaVersion": 38,
+    "version": 0,
+    "refresh": "5s",
+    "panels": [
+        # Panel 1: Performance Journalière
+        _timeseries_panel(1, "Performance Journalière", 0, 0, [
+            {
+                "query": _FLUX_QUERIES["daily_return"],
+                "refId": "A"
+            }
+        ], _POSITIVE_THRESHOLDS),
+        # Panel 2: Win Rate
+        _panel(2, "Win Rate", "gauge", 12, 0, [
+            {
+                "query": _FLUX_QUERIES["win_rate"],
+                "refId": "A"
+            }
+        ], {
+            "mappings": [],
+            "thresholds": {
+                "mode": "percentage",
+                "steps": [
+                    {"color": "red", "value": None},
+                    {"color": "yellow", "value": 50},
+                    {"color": "green", "value": 70}
+                ]
+            },
+            "unit": "percent"
+        }),
+        # Panel 3: Drawdown et Volatilité
+        _timeseries_panel(3, "Risques", 0, 8, [
+            {
+                "query": _FLUX_QUERIES["drawdown"],
+                "refId": "A"
+            },
+            {
+                "query": _FLUX_QUERIES["volatility"],
+                "refId": "B"
+            }
+        ], {
+            "mode": "percentage",
+            "steps": [
+                {"color": "green", "value": None},
+                {"color": "yellow", "value": 5},
+                {"color": "red", "value": 8}
+            ]
+        }, unit="percent"),
+        # Panel 4: Volume d'Échange
+        _timeseries_panel(4, "Volume d'Échange", 12, 8, [
+            {
+                "query": _FLUX_QUERIES["trading_volume"],
+                "refId": "A"
+            }
+        ], _POSITIVE_THRESHOLDS)
+    ]
+}
+
+# Schéma minimal d'un dashboard: détecte une définition invalide avant
+# l'appel HTTP plutôt que par un 400 de Grafana
+_DASHBOARD_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["uid", "title", "panels"],
+    "properties": {
+        "uid": {"type": "string", "minLength": 1, "maxLength": 40},
+        "title": {"type": "string", "minLength": 1},
+        "panels": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "title", "type", "gridPos", "targets"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "title": {"type": "string"},
+                    "type": {"type": "string"},
+                    "gridPos": {
+                        "type": "object",
+                        "required": ["h", "w", "x", "y"],
+                        "additionalProperties": {"type": "integer"}
+                    },
+                    "targets": {
+                        "type": "array",
+                        "items": {"type": "object", "required": ["refId"]}
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Validation compilée une seule fois, retirée en mode optimisé (python -O)
+_validate_dashboard = None
+if __debug__:
+    try:
+        import fastjsonschema
+        _validate_dashboard = fastjsonschema.compile(_DASHBOARD_SCHEMA)
+        _validate_dashboard(_DASHBOARD_TEMPLATE)
+    except ImportError:
+        logger.warning("fastjsonschema non installé: dashboards non validés")
+
+# Corps de requête pré-sérialisé pour la source de données par défaut
+_DASHBOARD_BODY = orjson.dumps({"dashboard": _DASHBOARD_TEMPLATE, "overwrite": True})
+_DASHBOARD_BODY_GZ = gzip.compress(_DASHBOARD_BODY, compresslevel=6)
+
+def _dashboard_hash(dashboard: Dict[str, Any]) -> str:
+    """
+    Calcule l'empreinte d'un dashboard, hors champs gérés par Grafana.
+    
+    Args:
+        dashboard (Dict[str, Any]): Définition du dashboard
+        
+    Returns:
+        str: Empreinte sha256 hexadécimale
+    """
+    content = {k: v for k, v in dashboard.items() if k not in ('id', 'version')}
+    return hashlib.sha256(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _raise_for_status(response) -> None:
+    """
+    Lève une exception pour une réponse en erreur, après avoir journalisé
+    le début du corps (le corps n'est lu que sur le chemin d'erreur).
+    
+    Args:
+        response (requests.Response): Réponse de l'API Grafana
+    """
+    if response.status_code >= 400:
+        logger.error("Erreur Grafana %s sur %s: %s",
+                     response.status_code, response.url, response.content[:512])
+    response.raise_for_status()
+
+def _atomic_write(path: str, content: bytes) -> None:
+    """
+    Écrit un fichier de façon atomique (fichier temporaire puis os.replace).
+    
+    Le fichier temporaire est créé en 0600: les droits usuels (0666 moins
+    l'umask) sont rétablis pour que Grafana, qui tourne sous son propre
+    utilisateur, puisse lire les fichiers provisionnés.
+    
+    Args:
+        path (str): Chemin du fichier
+        content (bytes): Contenu à écrire
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False, suffix='.tmp') as f:
+        f.write(content)
+    os.chmod(f.name, 0o666 & ~_UMASK)
+    os.replace(f.name, path)
+
+class _DeployCache:
+    """
+    Cache SQLite des ressources déjà déployées, par instance Grafana.
+    
+    Permet de sauter tout appel HTTP lorsqu'une ressource n'a pas changé
+    depuis le dernier déploiement réussi (exécutions CI successives).
+    """
+    def __init__(self, path: str):
+        """
+        Initialise le cache.
+        
+        Args:
+            path (str): Chemin de la base SQLite
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS deploys('
+                'url TEXT, uid TEXT, sha TEXT, version INT, PRIMARY KEY(url, uid))'
+            )
+            
+    def get(self, url: str, uid: str) -> Optional[str]:
+        """
+        Retourne l'empreinte du dernier déploiement réussi.
+        
+        Args:
+            url (str): URL de l'instance Grafana
+            uid (str): Identifiant de la ressource
+            
+        Returns:
+            Optional[str]: Empreinte sha256, ou None si jamais déployée
+        """
+        # Une connexion par appel: les méthodes sont appelées depuis plusieurs threads
+        with sqlite3.connect(self.path) as conn:
+            row = conn.execute(
+                'SELECT sha FROM deploys WHERE url = ? AND uid = ?', (url, uid)
+            ).fetchone()
+        return row[0] if row else None
+        
+    def put(self, url: str, uid: str, sha: str, version: Optional[int] = None) -> None:
+        """
+        Enregistre un déploiement réussi.
+        
+        Args:
+            url (str): URL de l'instance Grafana
+            uid (str): Identifiant de la ressource
+            sha (str): Empreinte sha256 déployée
+            version (Optional[int]): Version renvoyée par Grafana
+        """
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO deploys(url, uid, sha, version) VALUES (?, ?, ?, ?)',
+                (url, uid, sha, version)
+            )
+
 class GrafanaDashboardDeployer:
     """
     Déployeur de dashboard Grafana pour le bot de trading.
     """
+    _BASE_HEADERS = {'Content-Type': 'application/json'}
+    
     def __init__(self, 
                  grafana_url: str,
                  api_key: str,
-                 datasource_name: str = "trading_metrics"):
+                 datasource_name: str = DEFAULT_DATASOURCE,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 dedup_ttl: float = 60.0):
         """
         Initialise le déployeur de dashboard.
         
@@ -22,402 +368,389 @@ class GrafanaDashboardDeployer:
             grafana_url (str): URL de l'instance Grafana
             api_key (str): Clé API Grafana
             datasource_name (str): Nom de la source de données
+            cache_path (Optional[str]): Base SQLite des déploiements, None pour désactiver
+            dedup_ttl (float): Durée (s) pendant laquelle un déploiement réussi
+                identique n'est pas rejoué
         """
-        self.grafana_url = grafana_url.rstrip('/')
+        self.grafana_url = grafana_url[:-1] if grafana_url.endswith('/') else grafana_url
         self.api_key = api_key
         self.datasource_name = datasource_name
-        self.headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
+        self.headers = {**self._BASE_HEADERS, 'Authorization': f'Bearer {api_key}'}
+        
+        # Session créée au premier appel HTTP (import de requests différé)
+        self._sess = None
+        self._sess_lock = threading.Lock()
+        
+        # Désactivé si Grafana refuse les corps compressés
+        self._gzip = True
+        
+        # Base des déploiements ouverte au premier appel à l'API seulement:
+        # le provisioning sur disque n'en a pas besoin
+        self._cache_path = cache_path
+        self._cache: Optional[_DeployCache] = None
+        self._cache_lock = threading.Lock()
+        
+        # Existence de la source de données déjà vérifiée dans ce processus
+        self._ds_exists = False
+        
+        # Dernier déploiement réussi, pour ignorer les appels répétés
+        self._dedup_ttl = dedup_ttl
+        self._last_deploy_key = None
+        self._last_deploy_ts = float('-inf')
+        
+    def _get_cache(self) -> Optional[_DeployCache]:
+        """
+        Retourne le cache des déploiements, ouvert au premier appel.
+        
+        Returns:
+            Optional[_DeployCache]: Cache, ou None s'il est désactivé
+        """
+        with self._cache_lock:
+            if self._cache is None and self._cache_path:
+                self._cache = _DeployCache(self._cache_path)
+            return self._cache
+            
+    def _session(self):
+        """
+        Retourne la session HTTP partagée, créée au premier appel.
+        
+        Les connexions keep-alive sont réutilisées entre les appels et les
+        erreurs transitoires sont rejouées par l'adaptateur.
+        
+        Returns:
+            requests.Session: Session configurée
+        """
+        with self._sess_lock:
+            if self._sess is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=max(16, DEPLOY_CONCURRENCY),
+                    max_retries=Retry(
+                        total=5,
+                        backoff_factor=0.5,
+                        status_forcelist=[429, 502, 503, 504],
+                        allowed_methods=['GET', 'POST']
+                    )
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sess = session
+            return self._sess
+            
+    def close(self) -> None:
+        """
+        Ferme la session HTTP et libère le pool de connexions.
+        """
+        if self._sess is not None:
+            self._sess.close()
+            self._sess = None
+        
+    def __enter__(self) -> 'GrafanaDashboardDeployer':
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def _datasource_config(self) -> Dict[str, Any]:
+        """
+        Retourne la définition de la source de données InfluxDB.
+        
+        Returns:
+            Dict[str, Any]: Configuration de la source de données
+        """
+        return {
+            "name": self.datasource_name,
+            "type": "influxdb",
+            "url": "http://influxdb:8086",
+            "access": "proxy",
+            "database": "trading_metrics",
+            "jsonData": {
+                "organization": "trading_bot",
+                "defaultBucket": "trading_metrics",
+                "version": "Flux"
+            }
         }
         
+    def _dashboard(self, template: Dict[str, Any] = _DASHBOARD_TEMPLATE) -> Dict[str, Any]:
+        """
+        Retourne un dashboard pointant vers la source de données configurée.
+        
+        Args:
+            template (Dict[str, Any]): Dashboard référençant la source par défaut
+            
+        Returns:
+            Dict[str, Any]: Définition du dashboard
+        """
+        if self.datasource_name == DEFAULT_DATASOURCE:
+            return template
+        dashboard = copy.deepcopy(template)
+        for panel in dashboard["panels"]:
+            panel["datasource"] = self.datasource_name
+        return dashboard
+        
     def create_datasource(self) -> bool:
         """
         Crée la source de données dans Grafana.
         
         Returns:
-            bool: True si la création est réussie
+            bool: True si la source de données existe après l'appel
+            
+        Raises:
+            requests.HTTPError: Si Grafana refuse la création
         """
-        try:
-            datasource_config = {
-                "name": self.datasource_name,
-                "type": "influxdb",
-                "url": "http://influxdb:8086",
-                "access": "proxy",
-                "database": "trading_metrics",
-                "jsonData": {
-                    "organization": "trading_bot",
-                    "defaultBucket": "trading_metrics",
-                    "version": "Flux"
-                }
-            }
+        datasource_config = self._datasource_config()
+        cache_key = f"datasource:{self.datasource_name}"
+        sha = hashlib.sha256(orjson.dumps(datasource_config, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        if self._ds_exists:
+            return True
+        cache = self._get_cache()
+        if cache and cache.get(self.grafana_url, cache_key) == sha:
+            logger.info("Source de données inchangée depuis le dernier déploiement")
+            self._ds_exists = True
+            return True
             
-            response = requests.post(
+        # GET sans corps plutôt qu'un POST complet rejeté par un 409
+        response = self._session().get(
+            f"{self.grafana_url}/api/datasources/name/{quote(self.datasource_name, safe='')}",
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 200:
+            logger.info("Source de données déjà existante")
+        else:
+            if response.status_code != 404:
+                _raise_for_status(response)
+                
+            response = self._session().post(
                 f"{self.grafana_url}/api/datasources",
-                headers=self.headers,
-                json=datasource_config
+                data=orjson.dumps(datasource_config),
+                timeout=REQUEST_TIMEOUT
             )
             
-            if response.status_code == 200:
-                logger.info("Source de données créée avec succès")
-                return True
+            # 409: source de données créée entre-temps
+            if response.status_code == 409:
+                logger.info("Source de données déjà existante")
             else:
-                logger.error(f"Erreur lors de la création de la source de données: {response.text}")
-                return False
+                _raise_for_status(response)
+                logger.info("Source de données créée avec succès")
                 
-        except Exception as e:
-            logger.error(f"Erreur lors de la création de la source de données: {str(e)}")
-            return False
+        self._ds_exists = True
+        if cache:
+            cache.put(self.grafana_url, cache_key, sha)
+        return True
+        
+    def _remote_hash(self, uid: str) -> Optional[str]:
+        """
+        Récupère l'empreinte d'un dashboard déjà déployé dans Grafana.
+        
+        Args:
+            uid (str): Identifiant du dashboard
             
-    def create_dashboard(self) -> bool:
+        Returns:
+            Optional[str]: Empreinte sha256, ou None si le dashboard est absent
+        """
+        response = self._session().get(
+            f"{self.grafana_url}/api/dashboards/uid/{uid}",
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 404:
+            return None
+        _raise_for_status(response)
+        return _dashboard_hash(response.json()['dashboard'])
+        
+    def _post_dashboard(self, template: Dict[str, Any]) -> bool:
         """
-        Crée le dashboard dans Grafana.
+        Envoie un dashboard à Grafana s'il a changé.
         
+        Args:
+            template (Dict[str, Any]): Dashboard référençant la source par défaut
+            
         Returns:
-            bool: True si la création est réussie
+            bool: True si le dashboard est à jour après l'appel
+            
+        Raises:
+            requests.HTTPError: Si Grafana refuse le dashboard
         """
-        try:
-            dashboard_config = {
-                "dashboard": {
-                    "id": None,
-                    "uid": "trading-bot-dashboard",
-                    "title": "Trading Bot Dashboard",
-                    "tags": ["trading", "crypto"],
-                    "timezone": "browser",
-                    "schemaVersion": 38,
-                    "version": 0,
-                    "refresh": "5s",
-                    "panels": [
-                        # Panel 1: Performance Journalière
-                        {
-                            "id": 1,
-                            "title": "Performance Journalière",
-                            "type": "timeseries",
-                            "datasource": self.datasource_name,
-                            "gridPos": {
-                                "h": 8,
-                                "w": 12,
-                                "x": 0,
-                                "y": 0
-                            },
-                            "targets": [
-                                {
-                                    "query": """
-                                    from(bucket: "trading_metrics")
-                                        |> range(start: -7d)
-                                        |> filter(fn: (r) => r["_measurement"] == "daily_return")
-                                        |> yield(name: "mean")
-                                    """,
-                                    "refId": "A"
-                                }
-                            ],
-                            "fieldConfig": {
-                                "defaults": {
-                                    "color": {
-                                        "mode": "palette-classic"
-                                    },
-                                    "custom": {
-                                        "axisCenteredZero": False,
-                                        "axisColorMode": "text",
-                                        "axisLabel": "",
-                                        "axisPlacement": "auto",
-                                        "barAlignment": 0,
-                                        "drawStyle": "line",
-                                        "fillOpacity": 10,
-                                        "gradientMode": "none",
-                                        "hideFrom": {
-                                            "legend": False,
-                                            "tooltip": False,
-                                            "viz": False
-                                        },
-                                        "lineInterpolation": "linear",
-                                        "lineWidth": 1,
-                                        "pointSize": 5,
-                                        "scaleDistribution": {
-                                            "type": "linear"
-                                        },
-                                        "showPoints": "auto",
-                                        "spanNulls": False,
-                                        "stacking": {
-                                            "group": "A",
-                                            "mode": "none"
-                                        },
-                                        "thresholdsStyle": {
-                                            "mode": "off"
-                                        }
-                                    },
-                                    "mappings": [],
-                                    "thresholds": {
-                                        "mode": "absolute",
-                                        "steps": [
-                                            {
-                                                "color": "red",
-                                                "value": None
-                                            },
-                                            {
-                                                "color": "green",
-                                                "value": 0
-                                            }
-                                        ]
-                                    }
-                                }
-                            }
-                        },
-                        # Panel 2: Win Rate
-                        {
-                            "id": 2,
-                            "title": "Win Rate",
-                            "type": "gauge",
-                            "datasource": self.datasource_name,
-                            "gridPos": {
-                                "h": 8,
-                                "w": 12,
-                                "x": 12,
-                                "y": 0
-                            },
-                            "targets": [
-                                {
-                                    "query": """
-                                    from(bucket: "trading_metrics")
-                                        |> range(start: -1h)
-                                        |> filter(fn: (r) => r["_measurement"] == "win_rate")
-                                        |> last()
-                                    """,
-                                    "refId": "A"
-                                }
-                            ],
-                            "fieldConfig": {
-                                "defaults": {
-                                    "mappings": [],
-                                    "thresholds": {
-                                        "mode": "percentage",
-                                        "steps": [
-                                            {
-                                                "color": "red",
-                                                "value": None
-                                            },
-                                            {
-                                                "color": "yellow",
-                                                "value": 50
-                                            },
-                                            {
-                                                "color": "green",
-                                                "value": 70
-                                            }
-                                        ]
-                                    },
-                                    "unit": "percent"
-                                }
-                            }
-                        },
-                        # Panel 3: Drawdown et Volatilité
-                        {
-                            "id": 3,
-                            "title": "Risques",
-                            "type": "timeseries",
-                            "datasource": self.datasource_name,
-                            "gridPos": {
-                                "h": 8,
-                                "w": 12,
-                                "x": 0,
-                                "y": 8
-                            },
-                            "targets": [
-                                {
-                                    "query": """
-                                    from(bucket: "trading_metrics")
-                                        |> range(start: -7d)
-                                        |> filter(fn: (r) => r["_measurement"] == "risk_metrics")
-                                        |> filter(fn: (r) => r["_field"] == "drawdown")
-                                    """,
-                                    "refId": "A"
-                                },
-                                {
-                                    "query": """
-                                    from(bucket: "trading_metrics")
-                                        |> range(start: -7d)
-                                        |> filter(fn: (r) => r["_measurement"] == "risk_metrics")
-                                        |> filter(fn: (r) => r["_field"] == "volatility")
-                                    """,
-                                    "refId": "B"
-                                }
-                            ],
-                            "fieldConfig": {
-                                "defaults": {
-                                    "color": {
-                                        "mode": "palette-classic"
-                                    },
-                                    "custom": {
-                                        "axisCenteredZero": False,
-                                        "axisColorMode": "text",
-                                        "axisLabel": "",
-                                        "axisPlacement": "auto",
-                                        "barAlignment": 0,
-                                        "drawStyle": "line",
-                                        "fillOpacity": 10,
-                                        "gradientMode": "none",
-                                        "hideFrom": {
-                                            "legend": False,
-                                            "tooltip": False,
-                                            "viz": False
-                                        },
-                                        "lineInterpolation": "linear",
-                                        "lineWidth": 1,
-                                        "pointSize": 5,
-                                        "scaleDistribution": {
-                                            "type": "linear"
-                                        },
-                                        "showPoints": "auto",
-                                        "spanNulls": False,
-                                        "stacking": {
-                                            "group": "A",
-                                            "mode": "none"
-                                        },
-                                        "thresholdsStyle": {
-                                            "mode": "off"
-                                        }
-                                    },
-                                    "mappings": [],
-                                    "thresholds": {
-                                        "mode": "percentage",
-                                        "steps": [
-                                            {
-                                                "color": "green",
-                                                "value": None
-                                            },
-                                            {
-                                                "color": "yellow",
-                                                "value": 5
-                                            },
-                                            {
-                                                "color": "red",
-                                                "value": 8
-                                            }
-                                        ]
-                                    },
-                                    "unit": "percent"
-                                }
-                            }
-                        },
-                        # Panel 4: Volume d'Échange
-                        {
-                            "id": 4,
-                            "title": "Volume d'Échange",
-                            "type": "timeseries",
-                            "datasource": self.datasource_name,
-                            "gridPos": {
-                                "h": 8,
-                                "w": 12,
-                                "x": 12,
-                                "y": 8
-                            },
-                            "targets": [
-                                {
-                                    "query": """
-                                    from(bucket: "trading_metrics")
-                                        |> range(start: -7d)
-                                        |> filter(fn: (r) => r["_measurement"] == "trading_volume")
-                                        |> yield(name: "mean")
-                                    """,
-                                    "refId": "A"
-                                }
-                            ],
-                            "fieldConfig": {
-                                "defaults": {
-                                    "color": {
-                                        "mode": "palette-classic"
-                                    },
-                                    "custom": {
-                                        "axisCenteredZero": False,
-                                        "axisColorMode": "text",
-                                        "axisLabel": "",
-                                        "axisPlacement": "auto",
-                                        "barAlignment": 0,
-                                        "drawStyle": "line",
-                                        "fillOpacity": 10,
-                                        "gradientMode": "none",
-                                        "hideFrom": {
-                                            "legend": False,
-                                            "tooltip": False,
-                                            "viz": False
-                                        },
-                                        "lineInterpolation": "linear",
-                                        "lineWidth": 1,
-                                        "pointSize": 5,
-                                        "scaleDistribution": {
-                                            "type": "linear"
-                                        },
-                                        "showPoints": "auto",
-                                        "spanNulls": False,
-                                        "stacking": {
-                                            "group": "A",
-                                            "mode": "none"
-                                        },
-                                        "thresholdsStyle": {
-                                            "mode": "off"
-                                        }
-                                    },
-                                    "mappings": [],
-                                    "thresholds": {
-                                        "mode": "absolute",
-                                        "steps": [
-                                            {
-                                                "color": "red",
-                                                "value": None
-                                            },
-                                            {
-                                                "color": "green",
-                                                "value": 0
-                                            }
-                                        ]
-                                    }
-                                }
-                            }
-                        }
-                    ]
-                },
-                "overwrite": True
-            }
+        if __debug__ and _validate_dashboard and template is not _DASHBOARD_TEMPLATE:
+            _validate_dashboard(template)
             
-            response = requests.post(
-                f"{self.grafana_url}/api/dashboards/db",
-                headers=self.headers,
-                json=dashboard_config
-            )
+        dashboard = self._dashboard(template)
+        uid = dashboard['uid']
+        sha = _dashboard_hash(dashboard)
+        cache = self._get_cache()
+        if cache and cache.get(self.grafana_url, uid) == sha:
+            logger.info("Dashboard %s inchangé depuis le dernier déploiement", uid)
+            return True
             
-            if response.status_code == 200:
-                logger.info("Dashboard créé avec succès")
-                return True
-            else:
-                logger.error(f"Erreur lors de la création du dashboard: {response.text}")
-                return False
+        # Pas d'upload si le dashboard distant est identique
+        if self._remote_hash(uid) == sha:
+            logger.info("Dashboard %s déjà à jour", uid)
+            if cache:
+                cache.put(self.grafana_url, uid, sha)
+            return True
+            
+        if dashboard is _DASHBOARD_TEMPLATE:
+            body, body_gz = _DASHBOARD_BODY, _DASHBOARD_BODY_GZ
+        else:
+            body = orjson.dumps({"dashboard": dashboard, "overwrite": True})
+            body_gz = gzip.compress(body, compresslevel=6)
+            
+        url = f"{self.grafana_url}/api/dashboards/db"
+        if self._gzip:
+            response = self._session().post(
+                url,
+                data=body_gz,
+                headers={'Content-Encoding': 'gzip'},
+                timeout=REQUEST_TIMEOUT
+            )
+            # Repli sur un corps non compressé
+            if response.status_code in (400, 415):
+                logger.warning("Corps gzip refusé par Grafana, envoi non compressé")
+                self._gzip = False
                 
-        except Exception as e:
-            logger.error(f"Erreur lors de la création du dashboard: {str(e)}")
-            return False
+        if not self._gzip:
+            response = self._session().post(
+                url,
+                data=body,
+                timeout=REQUEST_TIMEOUT
+            )
+            
+        _raise_for_status(response)
+        logger.info("Dashboard %s créé avec succès", uid)
+        if cache:
+            cache.put(self.grafana_url, uid, sha, response.json().get('version'))
+        return True
+        
+    def create_dashboard(self, dashboards: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Crée les dashboards dans Grafana.
+        
+        Les dashboards sont envoyés en parallèle sur la session partagée,
+        dans la limite de DEPLOY_CONCURRENCY requêtes simultanées.
+        
+        Args:
+            dashboards (Optional[List[Dict[str, Any]]]): Dashboards à déployer
+                (par défaut le dashboard du bot de trading)
+            
+        Returns:
+            bool: True si tous les dashboards sont à jour après l'appel
+            
+        Raises:
+            requests.HTTPError: Si Grafana refuse un dashboard
+        """
+        dashboards = dashboards or [_DASHBOARD_TEMPLATE]
+        if len(dashboards) == 1:
+            return self._post_dashboard(dashboards[0])
+            
+        workers = min(DEPLOY_CONCURRENCY, len(dashboards))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return all(executor.map(self._post_dashboard, dashboards))
             
-    def deploy(self) -> bool:
+    def provision(self, path: str = '/etc/grafana/provisioning',
+                  dashboards: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Écrit la source de données et les dashboards dans le répertoire de
+        provisioning de Grafana, qui les charge au démarrage sans appel API.
+        
+        Args:
+            path (str): Répertoire de provisioning de Grafana
+            dashboards (Optional[List[Dict[str, Any]]]): Dashboards à écrire
+                (par défaut le dashboard du bot de trading)
+            
+        Returns:
+            bool: True si les fichiers ont été écrits
+        """
+        dashboards_dir = os.path.join(path, 'dashboards')
+        
+        # Fichiers YAML écrits en JSON, syntaxe valide en YAML
+        _atomic_write(
+            os.path.join(path, 'datasources', f'{self.datasource_name}.yaml'),
+            orjson.dumps({"apiVersion": 1, "datasources": [self._datasource_config()]},
+                         option=orjson.OPT_INDENT_2)
+        )
+        _atomic_write(
+            os.path.join(dashboards_dir, 'trading_bot.yaml'),
+            orjson.dumps({
+                "apiVersion": 1,
+                "providers": [{
+                    "name": "trading_bot",
+                    "type": "file",
+                    "options": {"path": dashboards_dir}
+                }]
+            }, option=orjson.OPT_INDENT_2)
+        )
+        for template in dashboards or [_DASHBOARD_TEMPLATE]:
+            if __debug__ and _validate_dashboard and template is not _DASHBOARD_TEMPLATE:
+                _validate_dashboard(template)
+            _atomic_write(
+                os.path.join(dashboards_dir, f"{template['uid']}.json"),
+                orjson.dumps(self._dashboard(template), option=orjson.OPT_INDENT_2)
+            )
+        
+        logger.info("Dashboard provisionné dans %s", path)
+        return True
+        
+    def deploy(self, provisioning_dir: Optional[str] = None,
+               dashboards: Optional[List[Dict[str, Any]]] = None) -> bool:
         """
         Déploie le dashboard complet.
         
+        Grafana n'expose pas d'endpoint groupant source de données et
+        dashboard. Avec un répertoire de provisioning (volume partagé,
+        ConfigMap Kubernetes), les deux ressources sont écrites sur disque
+        sans aucun appel HTTP; sinon les deux appels à l'API partent en
+        parallèle sur la même session.
+        Un déploiement identique réussi depuis moins de dedup_ttl secondes
+        n'est pas rejoué.
+        
+        Args:
+            provisioning_dir (Optional[str]): Répertoire de provisioning de Grafana
+            dashboards (Optional[List[Dict[str, Any]]]): Dashboards à déployer
+                (par défaut le dashboard du bot de trading)
+            
         Returns:
             bool: True si le déploiement est réussi
+            
+        Raises:
+            requests.RequestException: Si un appel échoue après les tentatives
         """
-        try:
-            # Création de la source de données
-            if not self.create_datasource():
-                return False
-                
-            # Création du dashboard
-            if not self.create_dashboard():
-                return False
-                
-            logger.info("Déploiement du dashboard terminé avec succès")
+        deploy_key = (provisioning_dir, tuple(d['uid'] for d in dashboards or [_DASHBOARD_TEMPLATE]))
+        if (deploy_key == self._last_deploy_key
+                and time.monotonic() - self._last_deploy_ts < self._dedup_ttl):
+            logger.info("Déploiement identique effectué récemment, ignoré")
             return True
             
-        except Exception as e:
-            logger.error(f"Erreur lors du déploiement: {str(e)}")
-            return False
+        if provisioning_dir:
+            self.provision(provisioning_dir, dashboards)
+            self._remember_deploy(deploy_key)
+            return True
+            
+        # Les deux appels visent des endpoints indépendants: le dashboard
+        # ne référence la source de données que par son nom
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            datasource = executor.submit(self.create_datasource)
+            dashboard = executor.submit(self.create_dashboard, dashboards)
+            if not (datasource.result() and dashboard.result()):
+                return False
+                
+        self._remember_deploy(deploy_key)
+        logger.info("Déploiement du dashboard terminé avec succès")
+        return True
+        
+    def _remember_deploy(self, deploy_key: tuple) -> None:
+        """
+        Mémorise un déploiement réussi pour la déduplication.
+        
+        Args:
+            deploy_key (tuple): Répertoire de provisioning et uids déployés
+        """
+        self._last_deploy_key = deploy_key
+        self._last_deploy_ts = time.monotonic()
 
 def main():
     """
@@ -432,17 +765,23 @@ def main():
     # Récupération des variables d'environnement
     grafana_url = os.getenv('GRAFANA_URL', 'http://localhost:3000')
     api_key = os.getenv('GRAFANA_API_KEY')
+    provisioning_dir = os.getenv('GRAFANA_PROVISIONING_DIR')
     
-    if not api_key:
+    # La clé API n'est nécessaire que pour le déploiement via l'API
+    if not api_key and not provisioning_dir:
         logger.error("La clé API Grafana n'est pas définie")
         return
         
+    import requests
+    
     # Création et déploiement du dashboard
-    deployer = GrafanaDashboardDeployer(grafana_url, api_key)
-    if deployer.deploy():
+    with GrafanaDashboardDeployer(grafana_url, api_key or '') as deployer:
+        try:
+            deployer.deploy(provisioning_dir)
+        except (requests.RequestException, OSError) as e:
+            logger.error("Échec du déploiement du dashboard: %s", e)
+            raise SystemExit(1)
         logger.info("Dashboard déployé avec succès")
-    else:
-        logger.error("Échec du déploiement du dashboard")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
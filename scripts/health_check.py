@@ -1,20 +1,59 @@
 import os
-import json
+import orjson
 import logging
-import requests
-import psutil
+import asyncio
+import aiohttp
+import sys
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, replace, asdict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Awaitable, Callable, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit
 from .alert_manager import AlertManager
 from .cache_manager import CacheManager
 
+# psutil, redis et influxdb_client sont importés à la première utilisation
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+    from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+
 logger = logging.getLogger(__name__)
 
+# Lecture directe de /proc (Linux) plutôt que trois appels psutil
+PROC_AVAILABLE = os.path.exists('/proc/stat') and os.path.exists('/proc/meminfo')
+
+# Durée de validité (s) de la mesure d'occupation disque
+DISK_USAGE_TTL = 60
+
+# Durée de validité maximale (s) d'un échantillon CPU/mémoire/disque
+SYSTEM_SAMPLE_TTL = 10
+
+# slots=True n'est accepté par dataclass qu'à partir de Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
+class EndpointStatus:
+    """
+    État d'un composant vérifié par une sonde réseau.
+    """
+    status_code: int
+    response_time: float
+    is_healthy: bool
+    timestamp: str
+    metrics: Optional[Dict[str, Any]] = None
+
 class HealthChecker:
     """
     Gestionnaire de vérification de santé du système.
     """
+    # Gabarits des messages d'alerte, formatés seulement en cas de dépassement
+    _ALERT_HEADER = "⚠️ Alertes de santé:\n"
+    _CPU_TMPL = "CPU usage élevé: %s%%"
+    _MEMORY_TMPL = "Utilisation mémoire élevée: %s%%"
+    _DISK_TMPL = "Espace disque faible: %s%%"
+    _DOWN_TMPL = "%s non fonctionnel"
+    _SLOW_TMPL = "%s lent: %.2fs"
+    
     def __init__(self,
                  alert_manager: AlertManager,
                  cache_manager: CacheManager,
@@ -30,8 +69,40 @@ class HealthChecker:
         self.alert_manager = alert_manager
         self.cache_manager = cache_manager
         self.config = self._load_config(config_file)
+        
+        # Seuils extraits une fois pour éviter les accès imbriqués à chaque vérification
+        thresholds = self.config.get('thresholds', {})
+        self._cpu_thresh = float(thresholds.get('cpu_percent', 80))
+        self._memory_thresh = float(thresholds.get('memory_percent', 80))
+        self._disk_thresh = float(thresholds.get('disk_percent', 80))
+        self._resp_thresh = float(thresholds.get('response_time', 2.0))
+        self._timeout = aiohttp.ClientTimeout(total=self._resp_thresh)
+        self._cooldown_s = float(self.config.get('alert_cooldown', 1800))
         self.last_check = None
         self.health_status = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Clients natifs Redis et InfluxDB, créés au premier ping
+        self._redis: Optional['aioredis.Redis'] = None
+        self._influx: Optional['InfluxDBClientAsync'] = None
+        
+        # Amorce du compteur CPU: les appels suivants renvoient l'écart
+        # depuis l'appel précédent sans bloquer
+        self._prev_stat: Optional[Tuple[int, int]] = None
+        if PROC_AVAILABLE:
+            self._prev_stat = self._read_cpu_times()
+        else:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        
+        # L'occupation disque évolue lentement: mise en cache 60 s
+        self._disk_percent: Optional[float] = None
+        self._disk_checked_at = float('-inf')
+        
+        # Dernier échantillon système, réutilisé tant qu'il a moins de
+        # min(check_interval / 2, SYSTEM_SAMPLE_TTL) secondes
+        self._sys_ttl = min(float(self.config.get('check_interval', 300)) / 2, SYSTEM_SAMPLE_TTL)
+        self._sys_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """
@@ -45,13 +116,13 @@ class HealthChecker:
         """
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+                with open(config_file, 'rb') as f:
+                    return orjson.loads(f.read())
             return {
                 'endpoints': {
                     'api': 'https://crypto-ia.vercel.app/healthcheck',
-                    'database': 'http://localhost:8086/health',
-                    'redis': 'http://localhost:6379/health'
+                    'database': 'http://localhost:8086',
+                    'redis': 'redis://localhost:6379/0'
                 },
                 'thresholds': {
                     'cpu_percent': 80,
@@ -68,132 +139,306 @@ class HealthChecker:
             logger.error(f"Erreur lors du chargement de la configuration: {str(e)}")
             return {}
             
-    def check_system_resources(self) -> Dict[str, Any]:
+    @staticmethod
+    def _read_cpu_times() -> Tuple[int, int]:
+        """
+        Lit les compteurs CPU agrégés de /proc/stat.
+        
+        Returns:
+            Tuple[int, int]: (temps total, temps actif) en jiffies
+        """
+        with open('/proc/stat', 'rb') as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+        # guest et guest_nice sont déjà comptés dans user et nice
+        total = sum(fields[:8])
+        idle = fields[3] + fields[4]  # idle + iowait
+        return total, total - idle
+        
+    def _sample_proc_once(self) -> Dict[str, float]:
+        """
+        Mesure CPU, mémoire et disque en une seule lecture de /proc par ressource.
+        
+        Returns:
+            Dict[str, float]: Pourcentages d'utilisation CPU, mémoire et disque
+        """
+        # CPU: écart depuis l'échantillon précédent
+        total, busy = self._read_cpu_times()
+        prev_total, prev_busy = self._prev_stat
+        self._prev_stat = (total, busy)
+        elapsed = total - prev_total
+        cpu_percent = round(100.0 * (busy - prev_busy) / elapsed, 1) if elapsed > 0 else 0.0
+        
+        # Mémoire: même définition que psutil (total - disponible) / total
+        meminfo = {}
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                key, value = line.split(b':', 1)
+                meminfo[key] = int(value.split()[0])
+                if b'MemTotal' in meminfo and b'MemAvailable' in meminfo:
+                    break
+        mem_total = meminfo[b'MemTotal']
+        memory_percent = round(100.0 * (mem_total - meminfo[b'MemAvailable']) / mem_total, 1)
+        
+        # Disque: rafraîchi au plus toutes les DISK_USAGE_TTL secondes
+        now = time.monotonic()
+        if now - self._disk_checked_at > DISK_USAGE_TTL:
+            st = os.statvfs('/')
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            total_user = used + st.f_bavail * st.f_frsize
+            self._disk_percent = round(100.0 * used / total_user, 1) if total_user else 0.0
+            self._disk_checked_at = now
+            
+        return {
+            'cpu_percent': cpu_percent,
+            'memory_percent': memory_percent,
+            'disk_percent': self._disk_percent
+        }
+        
+    def check_system_resources(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
         """
         Vérifie les ressources système.
         
+        Args:
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
+            
         Returns:
             Dict[str, Any]: État des ressources
         """
         try:
-            return {
-                'cpu_percent': psutil.cpu_percent(interval=1),
-                'memory_percent': psutil.virtual_memory().percent,
-                'disk_percent': psutil.disk_usage('/').percent,
-                'timestamp': datetime.now().isoformat()
-            }
+            # Échantillon récent: pas de nouvelle mesure
+            now = time.monotonic()
+            if self._sys_cache is not None and now - self._sys_cache[0] < self._sys_ttl:
+                return dict(self._sys_cache[1])
+                
+            if PROC_AVAILABLE:
+                snapshot = {
+                    **self._sample_proc_once(),
+                    'timestamp': now_iso or datetime.now().isoformat()
+                }
+            else:
+                # Hors Linux: mesures psutil
+                import psutil
+                if now - self._disk_checked_at > DISK_USAGE_TTL:
+                    self._disk_percent = psutil.disk_usage('/').percent
+                    self._disk_checked_at = now
+                    
+                snapshot = {
+                    'cpu_percent': psutil.cpu_percent(interval=None),
+                    'memory_percent': psutil.virtual_memory().percent,
+                    'disk_percent': self._disk_percent,
+                    'timestamp': now_iso or datetime.now().isoformat()
+                }
+                
+            self._sys_cache = (now, snapshot)
+            return dict(snapshot)
         except Exception as e:
             logger.error(f"Erreur lors de la vérification des ressources: {str(e)}")
             return {}
             
-    def check_endpoint(self, url: str) -> Dict[str, Any]:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Retourne la session HTTP partagée, créée au premier appel.
+        
+        Returns:
+            aiohttp.ClientSession: Session réutilisant les connexions keep-alive
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+        
+    async def close(self) -> None:
+        """
+        Ferme la session HTTP et les clients Redis/InfluxDB.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        if self._influx is not None:
+            await self._influx.close()
+            self._influx = None
+        
+    async def check_endpoint(self, url: str, now_iso: Optional[str] = None) -> EndpointStatus:
         """
         Vérifie un endpoint.
         
         Args:
             url (str): URL à vérifier
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
             
         Returns:
-            Dict[str, Any]: État de l'endpoint
+            EndpointStatus: État de l'endpoint
         """
+        loop = asyncio.get_running_loop()
         try:
-            start_time = time.time()
-            response = requests.get(url, timeout=self.config['thresholds']['response_time'])
-            response_time = time.time() - start_time
-            
-            return {
-                'status_code': response.status_code,
-                'response_time': response_time,
-                'is_healthy': response.status_code == 200,
-                'timestamp': datetime.now().isoformat()
-            }
-        except requests.Timeout:
-            return {
-                'status_code': 408,
-                'response_time': self.config['thresholds']['response_time'],
-                'is_healthy': False,
-                'timestamp': datetime.now().isoformat()
-            }
+            start_time = loop.time()
+            async with self._get_session().get(
+                url,
+                timeout=self._timeout
+            ) as response:
+                # Lecture du corps: une réponse non consommée ferme la connexion
+                # au lieu de la rendre au pool keep-alive
+                await response.read()
+                response_time = loop.time() - start_time
+                
+                return EndpointStatus(
+                    response.status,
+                    response_time,
+                    response.status == 200,
+                    now_iso or datetime.now().isoformat()
+                )
+        except asyncio.TimeoutError:
+            return EndpointStatus(408, self._resp_thresh, False, now_iso or datetime.now().isoformat())
         except Exception as e:
             logger.error(f"Erreur lors de la vérification de l'endpoint {url}: {str(e)}")
-            return {
-                'status_code': 500,
-                'response_time': 0,
-                'is_healthy': False,
-                'timestamp': datetime.now().isoformat()
-            }
+            return EndpointStatus(500, 0.0, False, now_iso or datetime.now().isoformat())
             
-    def check_database(self) -> Dict[str, Any]:
+    async def check_ping(self, name: str, ping: Callable[[], Awaitable[Any]],
+                         now_iso: Optional[str] = None) -> EndpointStatus:
         """
-        Vérifie l'état de la base de données.
+        Vérifie un service via le ping de son protocole natif.
         
+        Args:
+            name (str): Nom du service (journalisation)
+            ping (Callable[[], Awaitable[Any]]): Ping renvoyant une valeur vraie si le service répond
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
+            
         Returns:
-            Dict[str, Any]: État de la base de données
+            EndpointStatus: État du service
         """
         try:
-            # Vérification de la connexion
-            db_status = self.check_endpoint(self.config['endpoints']['database'])
+            start_time = time.perf_counter()
+            is_healthy = bool(await asyncio.wait_for(ping(), self._resp_thresh))
+            response_time = time.perf_counter() - start_time
             
-            # Vérification des métriques
-            metrics = self.cache_manager.get('db_metrics')
-            if metrics:
-                return {
-                    **db_status,
-                    'metrics': metrics
-                }
-            return db_status
+            return EndpointStatus(
+                200 if is_healthy else 503,
+                response_time,
+                is_healthy,
+                now_iso or datetime.now().isoformat()
+            )
+        except asyncio.TimeoutError:
+            return EndpointStatus(408, self._resp_thresh, False, now_iso or datetime.now().isoformat())
+        except Exception as e:
+            logger.error(f"Erreur lors du ping de {name}: {str(e)}")
+            return EndpointStatus(500, 0.0, False, now_iso or datetime.now().isoformat())
             
+    def _get_redis(self) -> 'aioredis.Redis':
+        """
+        Retourne le client Redis (pool de connexions persistant).
+        
+        Returns:
+            aioredis.Redis: Client Redis
+        """
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            parts = urlsplit(self.config['endpoints']['redis'])
+            self._redis = aioredis.Redis(
+                host=parts.hostname or 'localhost',
+                port=parts.port or 6379,
+                password=parts.password or os.getenv('REDIS_PASSWORD'),
+                socket_connect_timeout=self._resp_thresh,
+                socket_timeout=self._resp_thresh
+            )
+        return self._redis
+        
+    def _get_influx(self) -> 'InfluxDBClientAsync':
+        """
+        Retourne le client InfluxDB.
+        
+        Returns:
+            InfluxDBClientAsync: Client InfluxDB
+        """
+        if self._influx is None:
+            from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+            parts = urlsplit(self.config['endpoints']['database'])
+            self._influx = InfluxDBClientAsync(
+                url=f"{parts.scheme}://{parts.netloc}",
+                token=os.getenv('INFLUXDB_TOKEN')
+            )
+        return self._influx
+        
+    async def _check_component(self, probe: Callable[[], Awaitable[EndpointStatus]],
+                               metrics_key: str) -> EndpointStatus:
+        """
+        Vérifie un composant à partir d'une sonde et de ses métriques publiées.
+        
+        Args:
+            probe (Callable[[], Awaitable[EndpointStatus]]): Sonde de connexion
+            metrics_key (str): Clé des métriques dans le cache
+            
+        Returns:
+            EndpointStatus: État du composant
+        """
+        # Vérification de la connexion
+        status = await probe()
+        
+        # Ajout des métriques publiées
+        metrics = self.cache_manager.get(metrics_key)
+        if metrics:
+            return replace(status, metrics=metrics)
+        return status
+        
+    async def check_database(self, now_iso: Optional[str] = None) -> EndpointStatus:
+        """
+        Vérifie l'état de la base de données.
+        
+        Args:
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
+            
+        Returns:
+            EndpointStatus: État de la base de données
+        """
+        try:
+            return await self._check_component(
+                lambda: self.check_ping('InfluxDB', self._get_influx().ping, now_iso),
+                'db_metrics'
+            )
         except Exception as e:
             logger.error(f"Erreur lors de la vérification de la base de données: {str(e)}")
-            return {}
+            return EndpointStatus(500, 0.0, False, now_iso or datetime.now().isoformat())
             
-    def check_redis(self) -> Dict[str, Any]:
+    async def check_redis(self, now_iso: Optional[str] = None) -> EndpointStatus:
         """
         Vérifie l'état de Redis.
         
+        Args:
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
+            
         Returns:
-            Dict[str, Any]: État de Redis
+            EndpointStatus: État de Redis
         """
         try:
-            # Vérification de la connexion
-            redis_status = self.check_endpoint(self.config['endpoints']['redis'])
-            
-            # Vérification des métriques
-            metrics = self.cache_manager.get('redis_metrics')
-            if metrics:
-                return {
-                    **redis_status,
-                    'metrics': metrics
-                }
-            return redis_status
-            
+            return await self._check_component(
+                lambda: self.check_ping('Redis', self._get_redis().ping, now_iso),
+                'redis_metrics'
+            )
         except Exception as e:
             logger.error(f"Erreur lors de la vérification de Redis: {str(e)}")
-            return {}
+            return EndpointStatus(500, 0.0, False, now_iso or datetime.now().isoformat())
             
-    def check_trading_bot(self) -> Dict[str, Any]:
+    async def check_trading_bot(self, now_iso: Optional[str] = None) -> EndpointStatus:
         """
         Vérifie l'état du bot de trading.
         
+        Args:
+            now_iso (Optional[str]): Horodatage ISO partagé par la vérification en cours
+            
         Returns:
-            Dict[str, Any]: État du bot
+            EndpointStatus: État du bot
         """
         try:
-            # Vérification de l'API
-            api_status = self.check_endpoint(self.config['endpoints']['api'])
-            
-            # Vérification des métriques
-            metrics = self.cache_manager.get('trading_metrics')
-            if metrics:
-                return {
-                    **api_status,
-                    'metrics': metrics
-                }
-            return api_status
-            
+            return await self._check_component(
+                lambda: self.check_endpoint(self.config['endpoints']['api'], now_iso),
+                'trading_metrics'
+            )
         except Exception as e:
             logger.error(f"Erreur lors de la vérification du bot: {str(e)}")
-            return {}
+            return EndpointStatus(500, 0.0, False, now_iso or datetime.now().isoformat())
             
     def should_alert(self, component: str) -> bool:
         """
@@ -206,19 +451,37 @@ class HealthChecker:
             bool: True si une alerte doit être envoyée
         """
         try:
+            # Horodatage epoch en secondes (le cache Redis survit aux redémarrages,
+            # contrairement à une horloge monotone); une ancienne valeur ISO
+            # déclenche simplement l'alerte
             last_alert = self.cache_manager.get(f'last_alert_{component}')
-            if not last_alert:
+            if not isinstance(last_alert, (int, float)):
                 return True
                 
-            last_alert_time = datetime.fromisoformat(last_alert)
-            cooldown = timedelta(seconds=self.config['alert_cooldown'])
-            
-            return datetime.now() - last_alert_time > cooldown
+            return time.time() - last_alert > self._cooldown_s
             
         except Exception as e:
             logger.error(f"Erreur lors de la vérification des alertes: {str(e)}")
             return True
             
+    def _evaluate_component(self, component: str, status: EndpointStatus, alerts: List[str]) -> bool:
+        """
+        Compare l'état d'un composant aux seuils et complète les alertes.
+        
+        Args:
+            component (str): Nom du composant
+            status (EndpointStatus): État du composant
+            alerts (List[str]): Alertes en cours de construction
+            
+        Returns:
+            bool: True si le composant est fonctionnel
+        """
+        if not status.is_healthy:
+            alerts.append(self._DOWN_TMPL % component)
+        if status.response_time > self._resp_thresh:
+            alerts.append(self._SLOW_TMPL % (component, status.response_time))
+        return status.is_healthy
+        
     async def run_health_check(self) -> bool:
         """
         Exécute une vérification de santé complète.
@@ -227,53 +490,58 @@ class HealthChecker:
             bool: True si tout est en bonne santé
         """
         try:
+            # Un seul horodatage pour toute la vérification
+            now = datetime.now()
+            now_iso = now.isoformat()
+            
             # Vérification des ressources système
-            system_status = self.check_system_resources()
+            system_status = self.check_system_resources(now_iso)
             self.health_status['system'] = system_status
             
-            # Vérification des composants
-            self.health_status['database'] = self.check_database()
-            self.health_status['redis'] = self.check_redis()
-            self.health_status['trading_bot'] = self.check_trading_bot()
-            
             # Analyse des résultats
             is_healthy = True
             alerts = []
             
-            # Vérification des ressources système
-            if system_status['cpu_percent'] > self.config['thresholds']['cpu_percent']:
-                alerts.append(f"CPU usage élevé: {system_status['cpu_percent']}%")
+            # Seuils des ressources système
+            if system_status['cpu_percent'] > self._cpu_thresh:
+                alerts.append(self._CPU_TMPL % system_status['cpu_percent'])
                 is_healthy = False
                 
-            if system_status['memory_percent'] > self.config['thresholds']['memory_percent']:
-                alerts.append(f"Utilisation mémoire élevée: {system_status['memory_percent']}%")
+            if system_status['memory_percent'] > self._memory_thresh:
+                alerts.append(self._MEMORY_TMPL % system_status['memory_percent'])
                 is_healthy = False
                 
-            if system_status['disk_percent'] > self.config['thresholds']['disk_percent']:
-                alerts.append(f"Espace disque faible: {system_status['disk_percent']}%")
+            if system_status['disk_percent'] > self._disk_thresh:
+                alerts.append(self._DISK_TMPL % system_status['disk_percent'])
                 is_healthy = False
                 
-            # Vérification des composants
-            for component, status in self.health_status.items():
-                if component != 'system':
-                    if not status.get('is_healthy', False):
-                        alerts.append(f"{component} non fonctionnel")
-                        is_healthy = False
-                        
-                    if status.get('response_time', 0) > self.config['thresholds']['response_time']:
-                        alerts.append(f"{component} lent: {status['response_time']:.2f}s")
-                        
-            # Envoi des alertes si nécessaire
+            # Vérification des composants en parallèle, puis évaluation des
+            # résultats en un seul passage (sans reparcourir health_status)
+            statuses = await asyncio.gather(
+                self.check_database(now_iso),
+                self.check_redis(now_iso),
+                self.check_trading_bot(now_iso)
+            )
+            for component, status in zip(('database', 'redis', 'trading_bot'), statuses):
+                self.health_status[component] = status
+                if not self._evaluate_component(component, status, alerts):
+                    is_healthy = False
+                    
+            # Envoi des alertes si nécessaire: un seul message regroupant
+            # toutes les alertes de la vérification, jamais un envoi par composant
             if alerts and self.should_alert('system'):
                 await self.alert_manager.send_telegram_alert(
-                    os.getenv('TELEGRAM_ADMIN_ID'),
-                    "⚠️ Alertes de santé:\n" + "\n".join(alerts)
+                    self._ALERT_HEADER + "\n".join(alerts),
+                    chat_id=os.getenv('TELEGRAM_ADMIN_ID')
                 )
-                self.cache_manager.set('last_alert_system', datetime.now().isoformat())
+                self.cache_manager.set('last_alert_system', time.time())
                 
             # Mise à jour du cache
-            self.cache_manager.set('health_status', self.health_status)
-            self.last_check = datetime.now()
+            self.cache_manager.set('health_status', {
+                component: asdict(status) if isinstance(status, EndpointStatus) else status
+                for component, status in self.health_status.items()
+            })
+            self.last_check = now
             
             return is_healthy
             
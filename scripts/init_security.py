@@ -9,14 +9,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def init_security():
+def init_security(security_manager: SecurityManager):
     """
     Initialise la sécurité et chiffre les données sensibles.
+    
+    Args:
+        security_manager (SecurityManager): Gestionnaire de sécurité à utiliser
     """
     try:
-        # Initialisation du gestionnaire de sécurité
-        security_manager = SecurityManager()
-        
         # Vérification du fichier .env
         if not os.path.exists(".env"):
             logger.error("Fichier .env non trouvé")
@@ -31,13 +31,14 @@ def init_security():
         logger.error(f"Erreur lors de l'initialisation de la sécurité: {str(e)}")
         raise
 
-def test_encryption():
+def test_encryption(security_manager: SecurityManager):
     """
     Teste le chiffrement et le déchiffrement.
+    
+    Args:
+        security_manager (SecurityManager): Gestionnaire de sécurité déjà initialisé
     """
     try:
-        security_manager = SecurityManager()
-        
         # Test de chiffrement simple
         test_data = "Données sensibles de test"
         encrypted = security_manager.encrypt_data(test_data)
@@ -76,11 +77,14 @@ def main():
     try:
         logger.info("Démarrage de l'initialisation de la sécurité")
         
+        # Un seul gestionnaire : la clé est chargée et le chiffreur créé une fois
+        security_manager = SecurityManager()
+        
         # Initialisation de la sécurité
-        init_security()
+        init_security(security_manager)
         
         # Tests de chiffrement
-        test_encryption()
+        test_encryption(security_manager)
         
         logger.info("Initialisation de la sécurité terminée avec succès")
         
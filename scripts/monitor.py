@@ -1,8 +1,12 @@
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 import asyncio
 import argparse
+import orjson
 from datetime import datetime
 from typing import Dict, Any
 from .monitoring_setup import MonitoringSetup
@@ -10,17 +14,39 @@ from .health_checker import HealthChecker
 from .security_manager import SecurityManager
 from .optimization_manager import OptimizationManager
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/monitoring.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Boucle d'événements uvloop (libuv) si disponible, boucle standard sinon
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configuration du logging : les enregistrements passent par une file,
+# les écritures fichier/console sont faites par un thread dédié
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('logs/monitoring.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Parseur construit une seule fois au chargement du module
+_PARSER = argparse.ArgumentParser(description='Script de monitoring du bot de trading')
+_PARSER.add_argument('--setup', action='store_true', help='Configure le monitoring')
+_PARSER.add_argument('--audit', action='store_true', help='Exécute un audit de sécurité')
+_PARSER.add_argument('--optimize', action='store_true', help='Optimise la stratégie de trading')
+_PARSER.add_argument('--report', action='store_true', help='Génère un rapport de monitoring')
+_PARSER.add_argument('--config', type=str, default='config/monitoring_config.json',
+                     help='Chemin du fichier de configuration')
+
 def parse_args():
     """
     Parse les arguments de la ligne de commande.
@@ -28,14 +54,88 @@ def parse_args():
     Returns:
         argparse.Namespace: Arguments parsés
     """
-    parser = argparse.ArgumentParser(description='Script de monitoring du bot de trading')
-    parser.add_argument('--setup', action='store_true', help='Configure le monitoring')
-    parser.add_argument('--audit', action='store_true', help='Exécute un audit de sécurité')
-    parser.add_argument('--optimize', action='store_true', help='Optimise la stratégie de trading')
-    parser.add_argument('--report', action='store_true', help='Génère un rapport de monitoring')
-    parser.add_argument('--config', type=str, default='config/monitoring_config.json',
-                      help='Chemin du fichier de configuration')
-    return parser.parse_args()
+    return _PARSER.parse_args()
+
+# Dossier des rapports, créé à la première sauvegarde seulement
+REPORTS_DIR = 'reports'
+_reports_dir_ready = False
+
+def _ensure_reports_dir() -> None:
+    """
+    Crée le dossier des rapports une seule fois par processus.
+    """
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        _reports_dir_ready = True
+        
+def save_report(report: Dict[str, Any]) -> str:
+    """
+    Sauvegarde un rapport de monitoring horodaté.
+    
+    Args:
+        report (Dict[str, Any]): Rapport à sauvegarder
+        
+    Returns:
+        str: Chemin du fichier écrit
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    report_file = os.path.join(REPORTS_DIR, f'monitoring_report_{timestamp}.json')
+    
+    _ensure_reports_dir()
+    with open(report_file, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        
+    logger.info(f"Rapport sauvegardé dans {report_file}")
+    return report_file
+    
+async def _do_setup(monitoring: MonitoringSetup) -> None:
+    """
+    Configure le monitoring.
+    """
+    logger.info("Configuration du monitoring...")
+    if await asyncio.to_thread(monitoring.setup_monitoring):
+        logger.info("Configuration terminée avec succès")
+    else:
+        logger.error("Échec de la configuration")
+        
+async def _do_audit(monitoring: MonitoringSetup) -> None:
+    """
+    Exécute l'audit de sécurité.
+    """
+    logger.info("Exécution de l'audit de sécurité...")
+    results = await asyncio.to_thread(monitoring.run_security_audit)
+    logger.info(f"Score de sécurité: {results['score']}")
+    logger.info(f"Vulnérabilités trouvées: {len(results['vulnerabilities'])}")
+    logger.info(f"Corrections appliquées: {len(results['fixes_applied'])}")
+    
+async def _do_optimize(monitoring: MonitoringSetup) -> None:
+    """
+    Optimise la stratégie de trading.
+    """
+    logger.info("Optimisation de la stratégie de trading...")
+    results = await asyncio.to_thread(monitoring.optimize_trading_strategy)
+    if results.get('success', False):
+        logger.info("Optimisation réussie")
+        logger.info(f"Paramètres optimaux: {results['parameters']}")
+    else:
+        logger.error("Échec de l'optimisation")
+        
+async def _do_report(monitoring: MonitoringSetup) -> None:
+    """
+    Génère et sauvegarde le rapport de monitoring.
+    """
+    logger.info("Génération du rapport de monitoring...")
+    report = await asyncio.to_thread(monitoring.generate_report)
+    save_report(report)
+    
+# Tâches disponibles, dans l'ordre d'exécution par défaut
+TASKS = {
+    'setup': _do_setup,
+    'audit': _do_audit,
+    'optimize': _do_optimize,
+    'report': _do_report
+}
 
 async def main():
     """
@@ -58,79 +158,25 @@ async def main():
             config_file=args.config
         )
         
-        # Exécution des tâches demandées
-        if args.setup:
-            logger.info("Configuration du monitoring...")
-            if monitoring.setup_monitoring():
-                logger.info("Configuration terminée avec succès")
-            else:
-                logger.error("Échec de la configuration")
-                
-        if args.audit:
-            logger.info("Exécution de l'audit de sécurité...")
-            results = monitoring.run_security_audit()
-            logger.info(f"Score de sécurité: {results['score']}")
-            logger.info(f"Vulnérabilités trouvées: {len(results['vulnerabilities'])}")
-            logger.info(f"Corrections appliquées: {len(results['fixes_applied'])}")
-            
-        if args.optimize:
-            logger.info("Optimisation de la stratégie de trading...")
-            results = monitoring.optimize_trading_strategy()
-            if results.get('success', False):
-                logger.info("Optimisation réussie")
-                logger.info(f"Paramètres optimaux: {results['parameters']}")
-            else:
-                logger.error("Échec de l'optimisation")
-                
-        if args.report:
-            logger.info("Génération du rapport de monitoring...")
-            report = monitoring.generate_report()
-            
-            # Sauvegarde du rapport
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            report_file = f'reports/monitoring_report_{timestamp}.json'
-            
-            os.makedirs('reports', exist_ok=True)
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=4)
-                
-            logger.info(f"Rapport sauvegardé dans {report_file}")
-            
-        # Si aucune tâche n'est spécifiée, exécute toutes les tâches
-        if not any([args.setup, args.audit, args.optimize, args.report]):
+        # Tâches demandées, toutes si aucune n'est spécifiée
+        selected = [name for name in TASKS if getattr(args, name)]
+        if not selected:
             logger.info("Exécution de toutes les tâches de monitoring...")
+            selected = list(TASKS)
             
-            # Configuration
-            if monitoring.setup_monitoring():
-                logger.info("Configuration terminée avec succès")
-            else:
-                logger.error("Échec de la configuration")
-                
-            # Audit de sécurité
-            security_results = monitoring.run_security_audit()
-            logger.info(f"Score de sécurité: {security_results['score']}")
-            
-            # Optimisation
-            optimization_results = monitoring.optimize_trading_strategy()
-            if optimization_results.get('success', False):
-                logger.info("Optimisation réussie")
-            else:
-                logger.error("Échec de l'optimisation")
-                
-            # Rapport
-            report = monitoring.generate_report()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            report_file = f'reports/monitoring_report_{timestamp}.json'
-            
-            os.makedirs('reports', exist_ok=True)
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=4)
-                
-            logger.info(f"Rapport sauvegardé dans {report_file}")
-            
+        # La configuration passe en premier; l'audit et l'optimisation sont
+        # indépendants. Le rapport réutilise leurs résultats: il vient en dernier.
+        if 'setup' in selected:
+            await TASKS['setup'](monitoring)
+        await asyncio.gather(*(TASKS[name](monitoring) for name in selected if name in ('audit', 'optimize')))
+        if 'report' in selected:
+            await TASKS['report'](monitoring)
+        
     except Exception as e:
         logger.error(f"Erreur lors de l'exécution du script: {str(e)}")
         sys.exit(1)
 
 if __name__ == '__main__':
-    asyncio.run(main()) 
\ No newline at end of file
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main()) 
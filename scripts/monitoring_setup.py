@@ -1,17 +1,42 @@
 import os
-import json
+import time
+import orjson
+import threading
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import numpy as np
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from .health_checker import HealthChecker
 from .security_manager import SecurityManager
 from .optimization_manager import OptimizationManager
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def _read_config(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lit et décode un fichier de configuration, mis en cache par version du fichier.
+    
+    La date de modification et la taille font partie de la clé: un fichier
+    modifié est relu, un fichier inchangé n'est analysé qu'une fois par
+    processus. Le dictionnaire retourné est partagé et ne doit pas être modifié.
+    
+    Args:
+        config_file (str): Chemin du fichier de configuration
+        mtime_ns (int): Date de modification (ns)
+        size (int): Taille du fichier (octets)
+        
+    Returns:
+        Dict[str, Any]: Configuration décodée
+    """
+    with open(config_file, 'rb') as f:
+        return orjson.loads(f.read())
+
 class MonitoringSetup:
     """
     Gestionnaire de configuration du monitoring.
@@ -35,6 +60,51 @@ class MonitoringSetup:
         self.optimization_manager = optimization_manager
         self.config = self._load_config(config_file)
         
+        # Résultats coûteux (audit, optimisation) réutilisés pendant cache_ttl secondes
+        self._cache_ttl = float(self.config.get('cache_ttl', 300))
+        self._result_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_locks: Dict[str, threading.Lock] = {}
+        
+        # Données de marché chargées une fois, relues si le fichier change
+        self._data: Optional[pd.DataFrame] = None
+        self._data_mtime_ns: Optional[int] = None
+        
+        # Session Grafana persistante: connexions TCP/TLS réutilisées d'un appel à l'autre
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Requête du dashboard sérialisée une fois: la configuration ne
+        # change pas pendant la vie du processus
+        self._dashboard_payload: Optional[bytes] = None
+        grafana = self.config.get('grafana')
+        if grafana:
+            self._session.headers['Content-Type'] = 'application/json'
+            # Clé optionnelle: seuls les appels à Grafana en ont besoin
+            api_key = grafana.get('api_key')
+            if api_key:
+                self._session.headers['Authorization'] = f'Bearer {api_key}'
+            self._dashboard_payload = orjson.dumps({
+                'dashboard': {
+                    'id': None,
+                    'title': grafana['dashboard']['title'],
+                    'panels': grafana['dashboard']['panels'],
+                    'refresh': '5s',
+                    'time': {
+                        'from': 'now-7d',
+                        'to': 'now'
+                    }
+                },
+                'overwrite': True
+            })
+        
+    def close(self):
+        """
+        Ferme la session HTTP Grafana.
+        """
+        self._session.close()
+        
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """
         Charge la configuration du monitoring.
@@ -46,9 +116,12 @@ class MonitoringSetup:
             Dict[str, Any]: Configuration chargée
         """
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+            try:
+                st = os.stat(config_file)
+            except FileNotFoundError:
+                st = None
+            if st is not None:
+                return _read_config(config_file, st.st_mtime_ns, st.st_size)
             return {
                 'grafana': {
                     'url': 'http://localhost:3000',
@@ -90,7 +163,8 @@ class MonitoringSetup:
                     'data_window': '7d',
                     'iterations': 1000,
                     'risk_level': 3
-                }
+                },
+                'cache_ttl': 300  # 5 minutes
             }
         except Exception as e:
             logger.error(f"Erreur lors du chargement de la configuration: {str(e)}")
@@ -104,30 +178,17 @@ class MonitoringSetup:
             bool: True si la configuration est réussie
         """
         try:
-            headers = {
-                'Authorization': f'Bearer {self.config["grafana"]["api_key"]}',
-                'Content-Type': 'application/json'
-            }
-            
+            if self._dashboard_payload is None:
+                logger.error("Configuration Grafana manquante")
+                return False
+            if 'Authorization' not in self._session.headers:
+                logger.error("Clé API Grafana manquante (GRAFANA_API_KEY)")
+                return False
+                
             # Création du dashboard
-            dashboard_config = {
-                'dashboard': {
-                    'id': None,
-                    'title': self.config['grafana']['dashboard']['title'],
-                    'panels': self.config['grafana']['dashboard']['panels'],
-                    'refresh': '5s',
-                    'time': {
-                        'from': 'now-7d',
-                        'to': 'now'
-                    }
-                },
-                'overwrite': True
-            }
-            
-            response = requests.post(
+            response = self._session.post(
                 f"{self.config['grafana']['url']}/api/dashboards/db",
-                headers=headers,
-                json=dashboard_config
+                data=self._dashboard_payload
             )
             
             if response.status_code != 200:
@@ -141,9 +202,45 @@ class MonitoringSetup:
             logger.error(f"Erreur lors de la configuration de Grafana: {str(e)}")
             return False
             
+    def _memoized(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Retourne le dernier résultat calculé s'il a moins de cache_ttl secondes.
+        
+        Les résultats vides (échec) ne sont pas mis en cache. Un verrou par clé
+        garantit qu'un seul calcul est en cours: les appels concurrents
+        attendent puis réutilisent son résultat.
+        
+        Args:
+            key (str): Nom du résultat
+            compute (Callable[[], Dict[str, Any]]): Calcul à effectuer sinon
+            
+        Returns:
+            Dict[str, Any]: Résultat en cache ou recalculé
+        """
+        lock = self._cache_locks.setdefault(key, threading.Lock())
+        with lock:
+            now = time.monotonic()
+            cached = self._result_cache.get(key)
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                return cached[1]
+                
+            result = compute()
+            if result:
+                self._result_cache[key] = (now, result)
+            return result
+        
     def run_security_audit(self) -> Dict[str, Any]:
         """
-        Exécute un audit de sécurité.
+        Exécute un audit de sécurité (résultat réutilisé pendant cache_ttl secondes).
+        
+        Returns:
+            Dict[str, Any]: Résultats de l'audit
+        """
+        return self._memoized('security_audit', self._run_security_audit)
+        
+    def _run_security_audit(self) -> Dict[str, Any]:
+        """
+        Exécute l'audit de sécurité sans cache.
         
         Returns:
             Dict[str, Any]: Résultats de l'audit
@@ -187,20 +284,55 @@ class MonitoringSetup:
             logger.error(f"Erreur lors de l'audit de sécurité: {str(e)}")
             return {}
             
-    def optimize_trading_strategy(self) -> Dict[str, Any]:
+    def _prepared_data(self, data_file: str = 'data/latest.csv') -> pd.DataFrame:
+        """
+        Retourne les données de marché, analysées une seule fois par version du fichier.
+        
+        Args:
+            data_file (str): Chemin du fichier CSV
+            
+        Returns:
+            pd.DataFrame: Données indexées par timestamp
+        """
+        mtime_ns = os.stat(data_file).st_mtime_ns
+        if self._data is None or mtime_ns != self._data_mtime_ns:
+            # Parseur CSV multithread d'Arrow; les timestamps sont convertis par
+            # pandas, qui accepte plus de formats qu'Arrow (ISO 8601 seulement)
+            data = pacsv.read_csv(data_file).to_pandas(self_destruct=True)
+            data['timestamp'] = pd.to_datetime(data['timestamp'])
+            self._data = data.set_index('timestamp')
+            self._data_mtime_ns = mtime_ns
+        return self._data
+        
+    def optimize_trading_strategy(self, data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Optimise la stratégie de trading.
         
+        Sans données fournies, le résultat est réutilisé pendant cache_ttl secondes.
+        
+        Args:
+            data (Optional[pd.DataFrame]): Données déjà préparées, data/latest.csv sinon
+            
         Returns:
             Dict[str, Any]: Résultats de l'optimisation
         """
-        try:
-            # Chargement des données
-            data = pd.read_csv('data/latest.csv')
+        if data is not None:
+            return self._optimize_trading_strategy(data)
+        return self._memoized('optimization', self._optimize_trading_strategy)
+        
+    def _optimize_trading_strategy(self, data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Optimise la stratégie de trading sans cache.
+        
+        Args:
+            data (Optional[pd.DataFrame]): Données déjà préparées, data/latest.csv sinon
             
-            # Préparation des données
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            data.set_index('timestamp', inplace=True)
+        Returns:
+            Dict[str, Any]: Résultats de l'optimisation
+        """
+        try:
+            if data is None:
+                data = self._prepared_data()
             
             # Optimisation des paramètres
             results = self.optimization_manager.optimize(
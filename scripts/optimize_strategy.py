@@ -1,15 +1,21 @@
 import os
 import sys
-import json
+import orjson
 import logging
 import asyncio
 import argparse
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from .optimization_manager import OptimizationManager
 from .alert_manager import AlertManager
+from utils.backtest_kernels import rsi_reversal_trades, rsi_reversal_sweep
+from utils.indicator_kernels import ewma, wilder_rsi
+from utils._njit import NUMBA_AVAILABLE
 
 # Configuration du logging
 logging.basicConfig(
@@ -22,6 +28,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Taille (octets) des blocs lus à la fois dans le CSV de données
+CSV_BLOCK_SIZE = 16 << 20
+
+# Grille de recherche exhaustive des paramètres de la stratégie RSI
+RSI_PARAM_GRID = {
+    'rsi_oversold': [20, 25, 30, 35],
+    'rsi_overbought': [65, 70, 75, 80],
+    'take_profit': [0.01, 0.02, 0.03, 0.05],
+    'stop_loss': [0.01, 0.015, 0.02, 0.03]
+}
+
 def parse_args():
     """
     Parse les arguments de la ligne de commande.
@@ -36,6 +53,8 @@ def parse_args():
                       help='Nombre d\'itérations pour l\'optimisation')
     parser.add_argument('--risk-level', type=int, default=3,
                       help='Niveau de risque (1-5)')
+    parser.add_argument('--grid', action='store_true',
+                      help='Recherche exhaustive sur la grille RSI au lieu de l\'optimiseur')
     parser.add_argument('--config', type=str, default='config/monitoring_config.json',
                       help='Chemin du fichier de configuration')
     parser.add_argument('--output', type=str, default='reports/optimization.json',
@@ -53,12 +72,31 @@ def load_data(data_path: str) -> pd.DataFrame:
         pd.DataFrame: Données préparées
     """
     try:
-        # Chargement des données
-        data = pd.read_csv(data_path)
-        
-        # Conversion des timestamps
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-        data.set_index('timestamp', inplace=True)
+        # Lecture en flux par blocs depuis le fichier mappé en mémoire: chaque
+        # bloc est réduit aux deux colonnes utilisées avant le suivant, la
+        # mémoire suit donc le nombre de lignes et non la largeur du CSV
+        timestamps, closes = [], []
+        with pa.memory_map(data_path, 'r') as source:
+            reader = pacsv.open_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=['timestamp', 'close'],
+                    column_types={'timestamp': pa.timestamp('ns'), 'close': pa.float64()}
+                )
+            )
+            for batch in reader:
+                timestamps.append(batch.column('timestamp').to_numpy())
+                closes.append(batch.column('close').to_numpy(zero_copy_only=False))
+                
+        # Index construit directement depuis la colonne typée, sans set_index
+        data = pd.DataFrame(
+            {'close': np.concatenate(closes) if closes else np.empty(0)},
+            index=pd.DatetimeIndex(
+                np.concatenate(timestamps) if timestamps else np.empty(0, dtype='datetime64[ns]'),
+                name='timestamp'
+            )
+        )
         
         # Calcul des indicateurs techniques
         data['rsi'] = calculate_rsi(data['close'])
@@ -72,7 +110,7 @@ def load_data(data_path: str) -> pd.DataFrame:
 
 def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     """
-    Calcule le RSI.
+    Calcule le RSI (lissage de Wilder).
     
     Args:
         prices (pd.Series): Prix de clôture
@@ -81,11 +119,24 @@ def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         pd.Series: RSI calculé
     """
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+    values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+    if NUMBA_AVAILABLE or len(values) <= period:
+        return pd.Series(wilder_rsi(values, period, np.empty_like(values)), index=prices.index)
+        
+    # Sans Numba: même lissage via l'EWM compilé de pandas plutôt qu'une boucle Python
+    delta = np.diff(values)
+    gain = np.clip(delta, 0.0, None)
+    loss = np.clip(-delta, 0.0, None)
+    gain[period - 1] = gain[:period].mean()
+    loss[period - 1] = loss[:period].mean()
+    avg_gain = pd.Series(gain[period - 1:]).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(loss[period - 1:]).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+    
+    # Pas de baisse sur la période: RS infini, RSI à 100
+    rs = np.divide(avg_gain, avg_loss, out=np.full_like(avg_gain, np.inf), where=avg_loss != 0)
+    rsi = np.full_like(values, np.nan)
+    rsi[period:] = 100.0 - 100.0 / (1.0 + rs)
+    return pd.Series(rsi, index=prices.index)
 
 def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series]:
     """
@@ -100,11 +151,15 @@ def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: in
     Returns:
         Tuple[pd.Series, pd.Series]: MACD et signal
     """
-    exp1 = prices.ewm(span=fast, adjust=False).mean()
-    exp2 = prices.ewm(span=slow, adjust=False).mean()
-    macd = exp1 - exp2
-    signal_line = macd.ewm(span=signal, adjust=False).mean()
-    return macd, signal_line
+    values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+    exp1 = ewma(values, 2.0 / (fast + 1), np.empty_like(values))
+    exp2 = ewma(values, 2.0 / (slow + 1), np.empty_like(values))
+    
+    # La ligne MACD réutilise le tampon de l'EMA rapide
+    macd = np.subtract(exp1, exp2, out=exp1)
+    signal_line = ewma(macd, 2.0 / (signal + 1), exp2)
+    
+    return pd.Series(macd, index=prices.index), pd.Series(signal_line, index=prices.index)
 
 async def optimize_parameters(optimization_manager: OptimizationManager,
                             data: pd.DataFrame,
@@ -135,56 +190,122 @@ async def optimize_parameters(optimization_manager: OptimizationManager,
         logger.error(f"Erreur lors de l'optimisation: {str(e)}")
         return {}
 
-def evaluate_strategy(data: pd.DataFrame, parameters: Dict[str, Any]) -> Dict[str, float]:
+def build_param_matrix(param_grid: Dict[str, List[float]],
+                       names: Sequence[str]) -> np.ndarray:
+    """
+    Matérialise le produit cartésien d'une grille en une matrice contiguë.
+    
+    Args:
+        param_grid (Dict[str, List[float]]): Valeurs de chaque paramètre
+        names (Sequence[str]): Ordre des colonnes
+        
+    Returns:
+        np.ndarray: Matrice (n_combinaisons, n_paramètres) en float64, une ligne par combinaison
+    """
+    columns = [np.asarray(param_grid[name], dtype=np.float64) for name in names]
+    mesh = np.meshgrid(*columns, indexing='ij')
+    return np.ascontiguousarray(np.stack(mesh, axis=-1).reshape(-1, len(names)))
+
+def sweep_parameters(data: pd.DataFrame,
+                     param_grid: Dict[str, List[float]] = RSI_PARAM_GRID) -> Dict[str, Any]:
+    """
+    Évalue toutes les combinaisons de la grille en un seul appel au kernel parallèle.
+    
+    Args:
+        data (pd.DataFrame): Données de trading
+        param_grid (Dict[str, List[float]]): Valeurs de rsi_oversold, rsi_overbought,
+            take_profit et stop_loss
+        
+    Returns:
+        Dict[str, Any]: Résultats au format de optimize_parameters
+    """
+    try:
+        names = ('rsi_oversold', 'rsi_overbought', 'take_profit', 'stop_loss')
+        params = build_param_matrix(param_grid, names)
+        scores = rsi_reversal_sweep(
+            np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(data['rsi'].to_numpy(dtype=np.float64)),
+            params
+        )
+        
+        best = int(np.argmax(scores))
+        logger.info(f"{len(params)} combinaisons évaluées, meilleur Sharpe: {scores[best]:.4f}")
+        
+        return {
+            'success': bool(np.isfinite(scores[best])),
+            'parameters': {name: float(value) for name, value in zip(names, params[best])},
+            'score': float(scores[best])
+        }
+        
+    except Exception as e:
+        logger.error(f"Erreur lors de la recherche sur grille: {str(e)}")
+        return {}
+
+def simulate_strategy(data: pd.DataFrame,
+                      parameters: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simule la stratégie (kernel compilé par Numba si disponible).
+    
+    Args:
+        data (pd.DataFrame): Données de trading
+        parameters (Dict[str, Any]): Paramètres de la stratégie
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Indices d'entrée, indices de
+        sortie et PnL relatif des trades clôturés
+    """
+    return rsi_reversal_trades(
+        np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['rsi'].to_numpy(dtype=np.float64)),
+        float(parameters['rsi_oversold']),
+        float(parameters['rsi_overbought']),
+        float(parameters['take_profit']),
+        float(parameters['stop_loss'])
+    )
+
+def trade_log(data: pd.DataFrame,
+              trades: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> Dict[str, List[Any]]:
+    """
+    Convertit le journal des trades en listes sérialisables pour le rapport.
+    
+    Args:
+        data (pd.DataFrame): Données de trading
+        trades (Tuple[np.ndarray, np.ndarray, np.ndarray]): Résultat de simulate_strategy
+        
+    Returns:
+        Dict[str, List[Any]]: Dates d'entrée et de sortie, prix et PnL de chaque trade
+    """
+    entry_idx, exit_idx, pnls = trades
+    close = data['close'].to_numpy()
+    return {
+        'entry_time': data.index[entry_idx].astype(str).tolist(),
+        'exit_time': data.index[exit_idx].astype(str).tolist(),
+        'entry_price': close[entry_idx].tolist(),
+        'exit_price': close[exit_idx].tolist(),
+        'pnl': pnls.tolist()
+    }
+
+def evaluate_strategy(data: pd.DataFrame, parameters: Dict[str, Any],
+                      trades: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Dict[str, float]:
     """
     Évalue la stratégie avec les paramètres optimisés.
     
     Args:
         data (pd.DataFrame): Données de trading
         parameters (Dict[str, Any]): Paramètres optimisés
+        trades (Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Journal
+            déjà simulé, recalculé sinon
         
     Returns:
         Dict[str, float]: Métriques de performance
     """
     try:
-        # Simulation de la stratégie
-        trades = []
-        position = 0
-        entry_price = 0
-        
-        for i in range(len(data)):
-            if position == 0:  # Pas de position
-                if data['rsi'].iloc[i] < parameters['rsi_oversold']:
-                    position = 1
-                    entry_price = data['close'].iloc[i]
-                    trades.append({
-                        'type': 'buy',
-                        'price': entry_price,
-                        'timestamp': data.index[i]
-                    })
-                elif data['rsi'].iloc[i] > parameters['rsi_overbought']:
-                    position = -1
-                    entry_price = data['close'].iloc[i]
-                    trades.append({
-                        'type': 'sell',
-                        'price': entry_price,
-                        'timestamp': data.index[i]
-                    })
-            else:  # Position ouverte
-                current_price = data['close'].iloc[i]
-                pnl = (current_price - entry_price) / entry_price * position
-                
-                if pnl >= parameters['take_profit'] or pnl <= -parameters['stop_loss']:
-                    trades.append({
-                        'type': 'close',
-                        'price': current_price,
-                        'timestamp': data.index[i],
-                        'pnl': pnl
-                    })
-                    position = 0
-                    
+        if trades is None:
+            trades = simulate_strategy(data, parameters)
+        returns = trades[2]
+        
         # Calcul des métriques
-        if not trades:
+        if not len(returns):
             return {
                 'sharpe_ratio': 0,
                 'max_drawdown': 0,
@@ -193,18 +314,16 @@ def evaluate_strategy(data: pd.DataFrame, parameters: Dict[str, Any]) -> Dict[st
             }
             
         # Calcul du ratio de Sharpe
-        returns = pd.Series([t['pnl'] for t in trades if 'pnl' in t])
-        sharpe_ratio = np.sqrt(252) * returns.mean() / returns.std() if len(returns) > 1 else 0
+        sharpe_ratio = np.sqrt(252) * returns.mean() / returns.std(ddof=1) if len(returns) > 1 else 0
         
-        # Calcul du drawdown maximum
-        cumulative_returns = (1 + returns).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        drawdowns = (cumulative_returns - rolling_max) / rolling_max
-        max_drawdown = drawdowns.min()
+        # Calcul du drawdown maximum: (cr - max) / max = cr / max - 1, calculé
+        # dans le tampon du maximum courant sans autre temporaire
+        cumulative_returns = np.cumprod(1.0 + returns)
+        rolling_max = np.maximum.accumulate(cumulative_returns)
+        max_drawdown = np.divide(cumulative_returns, rolling_max, out=rolling_max).min() - 1.0
         
         # Calcul du taux de réussite
-        winning_trades = len(returns[returns > 0])
-        win_rate = winning_trades / len(returns)
+        win_rate = (returns > 0).mean()
         
         # Calcul du facteur de profit
         gross_profit = returns[returns > 0].sum()
@@ -230,6 +349,10 @@ async def main():
         # Parse des arguments
         args = parse_args()
         
+        # Dossier du rapport créé une seule fois, avant l'optimisation
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        
         # Initialisation des gestionnaires
         optimization_manager = OptimizationManager()
         alert_manager = AlertManager()
@@ -240,12 +363,15 @@ async def main():
         
         # Optimisation des paramètres
         logger.info("Démarrage de l'optimisation...")
-        results = await optimize_parameters(
-            optimization_manager,
-            data,
-            args.iterations,
-            args.risk_level
-        )
+        if args.grid:
+            results = sweep_parameters(data)
+        else:
+            results = await optimize_parameters(
+                optimization_manager,
+                data,
+                args.iterations,
+                args.risk_level
+            )
         
         if not results.get('success', False):
             logger.error("Échec de l'optimisation")
@@ -253,31 +379,32 @@ async def main():
             
         # Évaluation de la stratégie
         logger.info("Évaluation de la stratégie optimisée...")
-        metrics = evaluate_strategy(data, results['parameters'])
+        trades = simulate_strategy(data, results['parameters'])
+        metrics = evaluate_strategy(data, results['parameters'], trades)
         
         # Mise à jour des résultats
         results['metrics'] = metrics
+        results['trades'] = trade_log(data, trades)
         
         # Envoi des alertes si nécessaire
         if metrics['sharpe_ratio'] < 1.0 or metrics['win_rate'] < 0.5:
             await alert_manager.send_telegram_alert(
-                os.getenv('TELEGRAM_ADMIN_ID'),
                 f"⚠️ Performance de la stratégie sous-optimale:\n"
                 f"Ratio de Sharpe: {metrics['sharpe_ratio']:.2f}\n"
                 f"Taux de réussite: {metrics['win_rate']:.2%}\n"
-                f"Drawdown maximum: {metrics['max_drawdown']:.2%}"
+                f"Drawdown maximum: {metrics['max_drawdown']:.2%}",
+                chat_id=os.getenv('TELEGRAM_ADMIN_ID')
             )
             
         # Sauvegarde du rapport
-        os.makedirs(os.path.dirname(args.output), exist_ok=True)
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=4)
+        with open(output, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
-        logger.info(f"Rapport sauvegardé dans {args.output}")
+        logger.info(f"Rapport sauvegardé dans {output}")
         
         # Affichage du résumé
         print("\nRésumé de l'optimisation:")
-        print(f"Paramètres optimaux: {json.dumps(results['parameters'], indent=2)}")
+        print(f"Paramètres optimaux: {orjson.dumps(results['parameters'], option=orjson.OPT_INDENT_2).decode()}")
         print(f"Ratio de Sharpe: {metrics['sharpe_ratio']:.2f}")
         print(f"Taux de réussite: {metrics['win_rate']:.2%}")
         print(f"Drawdown maximum: {metrics['max_drawdown']:.2%}")
@@ -1,6 +1,7 @@
 import os
+import asyncio
 import logging
-import json
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from utils.optimization_manager import OptimizationManager
@@ -15,6 +16,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optimisations simultanées: chaque GridSearchCV occupe déjà tous les cœurs (n_jobs=-1)
+OPTIMIZE_CONCURRENCY = int(os.getenv('OPTIMIZE_CONCURRENCY', '1'))
+
 def load_base_strategy() -> Dict[str, Any]:
     """
     Charge la stratégie de base depuis le fichier de configuration.
@@ -23,12 +27,23 @@ def load_base_strategy() -> Dict[str, Any]:
         Dict[str, Any]: Paramètres de la stratégie de base
     """
     try:
-        with open('config/strategy_config.json', 'r') as f:
-            return json.load(f)
+        with open('config/strategy_config.json', 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Erreur lors du chargement de la stratégie de base: {str(e)}")
         raise
 
+def save_json(path: str, obj: Any) -> None:
+    """
+    Écrit un objet en JSON indenté (scalaires et tableaux NumPy compris).
+    
+    Args:
+        path (str): Chemin du fichier
+        obj (Any): Objet à sérialiser
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
 def define_param_grid() -> Dict[str, Any]:
     """
     Définit la grille de paramètres pour l'optimisation.
@@ -51,9 +66,89 @@ def define_param_grid() -> Dict[str, Any]:
         'bb_std': [1.5, 2.0, 2.5, 3.0]
     }
 
-def run_optimization():
+async def _ab_test_symbol(optimization_manager: OptimizationManager, symbol: str,
+                         base_strategy: Dict[str, Any], start_date: datetime,
+                         end_date: datetime) -> None:
+    """
+    Exécute et sauvegarde le test A/B d'un symbole.
+    
+    Args:
+        optimization_manager (OptimizationManager): Gestionnaire d'optimisation
+        symbol (str): Symbole à tester
+        base_strategy (Dict[str, Any]): Paramètres de la stratégie de base
+        start_date (datetime): Date de début
+        end_date (datetime): Date de fin
+    """
+    logger.info(f"Test A/B pour {symbol}")
+    ab_results = await asyncio.to_thread(
+        optimization_manager.run_ab_test,
+        symbol,
+        base_strategy,
+        start_date,
+        end_date
+    )
+    
+    # Sauvegarde des résultats
+    results_file = f"results/ab_test_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
+    os.makedirs(os.path.dirname(results_file), exist_ok=True)
+    save_json(results_file, ab_results)
+    
+    logger.info(f"Résultats A/B sauvegardés dans {results_file}")
+    
+async def _optimize_symbol(optimization_manager: OptimizationManager, symbol: str,
+                           base_strategy: Dict[str, Any], param_grid: Dict[str, Any],
+                           start_date: datetime, end_date: datetime,
+                           limiter: asyncio.Semaphore) -> None:
+    """
+    Optimise les paramètres d'un symbole et sauvegarde résultats et rapport.
+    
+    Args:
+        optimization_manager (OptimizationManager): Gestionnaire d'optimisation
+        symbol (str): Symbole à optimiser
+        base_strategy (Dict[str, Any]): Paramètres de la stratégie de base
+        param_grid (Dict[str, Any]): Grille de paramètres
+        start_date (datetime): Date de début
+        end_date (datetime): Date de fin
+        limiter (asyncio.Semaphore): Limite des optimisations simultanées
+    """
+    logger.info(f"Optimisation des paramètres pour {symbol}")
+    
+    # Création de la stratégie
+    strategy = AdvancedStrategy(**base_strategy)
+    
+    # Optimisation
+    async with limiter:
+        optimization_results = await asyncio.to_thread(
+            optimization_manager.optimize_parameters,
+            symbol,
+            strategy,
+            param_grid,
+            start_date,
+            end_date
+        )
+    
+    # Sauvegarde des résultats
+    results_file = f"results/optimization_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
+    save_json(results_file, optimization_results)
+    
+    logger.info(f"Résultats d'optimisation sauvegardés dans {results_file}")
+    
+    # Génération du rapport
+    report = optimization_manager.get_optimization_report(symbol)
+    report_file = f"reports/optimization_report_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
+    os.makedirs(os.path.dirname(report_file), exist_ok=True)
+    save_json(report_file, report)
+    
+    logger.info(f"Rapport d'optimisation généré: {report_file}")
+
+async def run_optimization():
     """
     Exécute l'optimisation continue des stratégies.
+    
+    Les tests A/B des symboles sont traités simultanément; les optimisations,
+    déjà parallélisées sur tous les cœurs, le sont dans la limite de
+    OPTIMIZE_CONCURRENCY. Les rapports d'optimisation lisent les résultats A/B,
+    d'où les deux phases successives.
     """
     try:
         # Initialisation des composants
@@ -74,55 +169,20 @@ def run_optimization():
         
         # Exécution des tests A/B
         logger.info("Démarrage des tests A/B")
-        for symbol in symbols:
-            logger.info(f"Test A/B pour {symbol}")
-            ab_results = optimization_manager.run_ab_test(
-                symbol,
-                base_strategy,
-                start_date,
-                end_date
-            )
-            
-            # Sauvegarde des résultats
-            results_file = f"results/ab_test_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
-            os.makedirs(os.path.dirname(results_file), exist_ok=True)
-            with open(results_file, 'w') as f:
-                json.dump(ab_results, f, indent=4)
-            
-            logger.info(f"Résultats A/B sauvegardés dans {results_file}")
+        await asyncio.gather(*(
+            _ab_test_symbol(optimization_manager, symbol, base_strategy, start_date, end_date)
+            for symbol in symbols
+        ))
         
-        # Optimisation des paramètres
+        # Optimisation des paramètres, en nombre limité pour ne pas multiplier
+        # les processus de GridSearchCV
         logger.info("Démarrage de l'optimisation des paramètres")
-        for symbol in symbols:
-            logger.info(f"Optimisation des paramètres pour {symbol}")
-            
-            # Création de la stratégie
-            strategy = AdvancedStrategy(**base_strategy)
-            
-            # Optimisation
-            optimization_results = optimization_manager.optimize_parameters(
-                symbol,
-                strategy,
-                param_grid,
-                start_date,
-                end_date
-            )
-            
-            # Sauvegarde des résultats
-            results_file = f"results/optimization_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
-            with open(results_file, 'w') as f:
-                json.dump(optimization_results, f, indent=4)
-            
-            logger.info(f"Résultats d'optimisation sauvegardés dans {results_file}")
-            
-            # Génération du rapport
-            report = optimization_manager.get_optimization_report(symbol)
-            report_file = f"reports/optimization_report_{symbol}_{datetime.now().strftime('%Y%m%d')}.json"
-            os.makedirs(os.path.dirname(report_file), exist_ok=True)
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=4)
-            
-            logger.info(f"Rapport d'optimisation généré: {report_file}")
+        limiter = asyncio.Semaphore(OPTIMIZE_CONCURRENCY)
+        await asyncio.gather(*(
+            _optimize_symbol(optimization_manager, symbol, base_strategy, param_grid,
+                             start_date, end_date, limiter)
+            for symbol in symbols
+        ))
         
         logger.info("Optimisation terminée avec succès")
         
@@ -136,7 +196,7 @@ def main():
     """
     try:
         logger.info("Démarrage de l'optimisation continue")
-        run_optimization()
+        asyncio.run(run_optimization())
         logger.info("Optimisation continue terminée")
         
     except Exception as e:
@@ -1,7 +1,10 @@
-import schedule
 import time
+import heapq
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 from utils.report_manager import ReportManager
 from utils.trading_bot import TradingBot
 from utils.sentiment_analyzer import SentimentAnalyzer
@@ -13,27 +16,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def generate_daily_report():
+# Heure du rapport quotidien et période de mise à jour des métriques (s)
+DAILY_REPORT_TIME = dt_time(23, 59)
+METRICS_INTERVAL = 5 * 60
+
+# Durée (s) pendant laquelle une donnée récupérée est partagée entre les tâches
+FETCH_TTL = 60
+
+# Dernières valeurs récupérées: clé -> (instant monotone, valeur)
+_fetch_cache: Dict[str, Tuple[float, Any]] = {}
+
+@lru_cache(maxsize=1)
+def _get_components() -> Tuple[ReportManager, TradingBot, SentimentAnalyzer]:
+    """
+    Crée une seule fois les gestionnaires partagés par toutes les tâches.
+    
+    Returns:
+        Tuple[ReportManager, TradingBot, SentimentAnalyzer]: Gestionnaires
+    """
+    return ReportManager(), TradingBot(), SentimentAnalyzer()
+
+def _cached_fetch(key: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Retourne la valeur récupérée il y a moins de FETCH_TTL secondes, ou la récupère.
+    
+    Args:
+        key (str): Nom de la donnée
+        fetch (Callable[[], Any]): Récupération en cas d'absence ou d'expiration
+        
+    Returns:
+        Any: Valeur partagée, à ne pas modifier
+    """
+    now = time.monotonic()
+    cached = _fetch_cache.get(key)
+    if cached is not None and now - cached[0] < FETCH_TTL:
+        return cached[1]
+    value = fetch()
+    _fetch_cache[key] = (now, value)
+    return value
+
+async def generate_daily_report():
     """
     Génère le rapport quotidien.
+    
+    Les quatre récupérations sont indépendantes et s'exécutent simultanément.
     """
     try:
-        # Initialisation des composants
-        report_manager = ReportManager()
-        trading_bot = TradingBot()
-        sentiment_analyzer = SentimentAnalyzer()
+        # Gestionnaires partagés entre les exécutions
+        report_manager, trading_bot, sentiment_analyzer = _get_components()
         
-        # Récupération des données
-        trades = trading_bot.get_daily_trades()
-        performance_metrics = trading_bot.get_performance_metrics()
-        market_data = trading_bot.get_market_data()
+        # Récupération des données et analyse du sentiment
+        trades, performance_metrics, market_data, sentiment_results = await asyncio.gather(
+            asyncio.to_thread(trading_bot.get_daily_trades),
+            asyncio.to_thread(_cached_fetch, 'performance_metrics', trading_bot.get_performance_metrics),
+            asyncio.to_thread(_cached_fetch, 'market_data', trading_bot.get_market_data),
+            asyncio.to_thread(_cached_fetch, 'sentiment_bitcoin',
+                              lambda: sentiment_analyzer.get_sentiment_score("Bitcoin"))
+        )
         
-        # Analyse du sentiment
-        sentiment_results = sentiment_analyzer.get_sentiment_score("Bitcoin")
-        market_data['sentiment'] = sentiment_results['average_sentiment']
+        # Copie: les données en cache restent intactes
+        market_data = market_data.assign(sentiment=sentiment_results['average_sentiment'])
         
         # Génération du rapport
-        report_path = report_manager.generate_daily_report(
+        report_path = await asyncio.to_thread(
+            report_manager.generate_daily_report,
             trades=trades,
             performance_metrics=performance_metrics,
             market_data=market_data
@@ -42,7 +88,7 @@ def generate_daily_report():
         logger.info(f"Rapport quotidien généré: {report_path}")
         
         # Mise à jour des métriques pour Grafana
-        report_manager.update_metrics({
+        await asyncio.to_thread(report_manager.update_metrics, {
             'daily_return': performance_metrics['daily_return'],
             'win_rate': performance_metrics['win_rate'],
             'sentiment_score': sentiment_results['average_sentiment'],
@@ -53,23 +99,24 @@ def generate_daily_report():
     except Exception as e:
         logger.error(f"Erreur lors de la génération du rapport: {str(e)}")
 
-def update_metrics():
+async def update_metrics():
     """
     Met à jour les métriques pour le dashboard Grafana.
     """
     try:
-        # Initialisation des composants
-        report_manager = ReportManager()
-        trading_bot = TradingBot()
-        sentiment_analyzer = SentimentAnalyzer()
+        # Gestionnaires partagés entre les exécutions
+        report_manager, trading_bot, sentiment_analyzer = _get_components()
         
         # Récupération des données
-        performance_metrics = trading_bot.get_performance_metrics()
-        market_data = trading_bot.get_market_data()
-        sentiment_results = sentiment_analyzer.get_sentiment_score("Bitcoin")
+        performance_metrics, market_data, sentiment_results = await asyncio.gather(
+            asyncio.to_thread(_cached_fetch, 'performance_metrics', trading_bot.get_performance_metrics),
+            asyncio.to_thread(_cached_fetch, 'market_data', trading_bot.get_market_data),
+            asyncio.to_thread(_cached_fetch, 'sentiment_bitcoin',
+                              lambda: sentiment_analyzer.get_sentiment_score("Bitcoin"))
+        )
         
         # Mise à jour des métriques
-        report_manager.update_metrics({
+        await asyncio.to_thread(report_manager.update_metrics, {
             'daily_return': performance_metrics['daily_return'],
             'win_rate': performance_metrics['win_rate'],
             'sentiment_score': sentiment_results['average_sentiment'],
@@ -81,24 +128,60 @@ def update_metrics():
     except Exception as e:
         logger.error(f"Erreur lors de la mise à jour des métriques: {str(e)}")
 
+def next_daily_run(at: dt_time, now: float) -> float:
+    """
+    Calcule la prochaine occurrence d'une heure fixe de la journée.
+    
+    Args:
+        at (dt_time): Heure locale d'exécution
+        now (float): Instant de référence (epoch)
+        
+    Returns:
+        float: Instant de la prochaine exécution (epoch)
+    """
+    now_dt = datetime.fromtimestamp(now)
+    run = datetime.combine(now_dt.date(), at)
+    if run <= now_dt:
+        run += timedelta(days=1)
+    return run.timestamp()
+
+async def scheduler():
+    """
+    Exécute les tâches planifiées en dormant jusqu'à la prochaine échéance.
+    
+    Les échéances sont gardées dans un tas; la boucle ne se réveille que
+    lorsqu'une tâche est due au lieu de scruter le planning chaque seconde.
+    Comme avec schedule, la prochaine échéance est calculée à la fin de la tâche.
+    """
+    now = time.time()
+    jobs: List[Tuple[float, int, Callable[[], Awaitable[None]], Callable[[float], float]]] = [
+        (next_daily_run(DAILY_REPORT_TIME, now), 0, generate_daily_report,
+         lambda t: next_daily_run(DAILY_REPORT_TIME, t)),
+        (now + METRICS_INTERVAL, 1, update_metrics, lambda t: t + METRICS_INTERVAL)
+    ]
+    heapq.heapify(jobs)
+    
+    while True:
+        due, seq, job, next_run = jobs[0]
+        delay = due - time.time()
+        if delay > 0:
+            # Nouvelle vérification au réveil (horloge système ajustée entre-temps)
+            await asyncio.sleep(delay)
+            continue
+            
+        await job()
+        heapq.heapreplace(jobs, (next_run(time.time()), seq, job, next_run))
+
 def main():
     """
     Fonction principale pour planifier les tâches.
     """
     try:
-        # Planification des tâches
-        schedule.every().day.at("23:59").do(generate_daily_report)
-        schedule.every(5).minutes.do(update_metrics)
-        
         logger.info("Planification des tâches démarrée")
+        asyncio.run(scheduler())
         
-        # Boucle principale
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
-            
     except Exception as e:
         logger.error(f"Erreur dans la boucle principale: {str(e)}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,10 +1,12 @@
 import os
 import sys
-import json
+import orjson
 import logging
 import asyncio
 import argparse
+import itertools
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List
 from .security_manager import SecurityManager
 from .alert_manager import AlertManager
@@ -20,6 +22,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pénalités appliquées au score de sécurité
+CRITICAL_PENALTY = 0.3
+VULNERABILITY_PENALTY = 0.01
+
 def parse_args():
     """
     Parse les arguments de la ligne de commande.
@@ -54,39 +60,43 @@ async def run_security_checks(security_manager: SecurityManager) -> Dict[str, An
     }
     
     try:
-        # Vérification des dépendances
-        logger.info("Vérification des dépendances...")
-        dependencies = await security_manager.check_dependencies()
-        results['checks']['dependencies'] = dependencies
-        results['vulnerabilities'].extend(dependencies)
-        
-        # Vérification des configurations
-        logger.info("Vérification des configurations...")
-        configs = await security_manager.check_configurations()
-        results['checks']['configurations'] = configs
-        results['vulnerabilities'].extend(configs)
-        
-        # Vérification des permissions
-        logger.info("Vérification des permissions...")
-        permissions = await security_manager.check_permissions()
-        results['checks']['permissions'] = permissions
-        results['vulnerabilities'].extend(permissions)
-        
-        # Vérification des clés API
-        logger.info("Vérification des clés API...")
-        api_keys = await security_manager.check_api_keys()
-        results['checks']['api_keys'] = api_keys
-        results['vulnerabilities'].extend(api_keys)
-        
-        # Vérification des logs
-        logger.info("Vérification des logs...")
-        logs = await security_manager.check_logs()
-        results['checks']['logs'] = logs
-        results['vulnerabilities'].extend(logs)
-        
-        # Calcul du score
-        total_vulns = len(results['vulnerabilities'])
-        results['score'] = 1.0 - (total_vulns / max(total_vulns, 1))
+        # Les cinq vérifications sont indépendantes: exécution concurrente
+        logger.info("Vérification des dépendances, configurations, permissions, clés API et logs...")
+        checks = {
+            'dependencies': security_manager.check_dependencies(),
+            'configurations': security_manager.check_configurations(),
+            'permissions': security_manager.check_permissions(),
+            'api_keys': security_manager.check_api_keys(),
+            'logs': security_manager.check_logs()
+        }
+        outcomes = await asyncio.gather(*checks.values(), return_exceptions=True)
+        
+        passed = []
+        failed = []
+        for name, outcome in zip(checks, outcomes):
+            # BaseException: une annulation (CancelledError) est aussi un échec
+            if isinstance(outcome, BaseException):
+                logger.error(f"Erreur lors de la vérification '{name}': {outcome!r}")
+                results['checks'][name] = {'error': repr(outcome)}
+                failed.append(name)
+            else:
+                results['checks'][name] = outcome
+                passed.append(outcome)
+                
+        vulnerabilities = list(itertools.chain.from_iterable(passed))
+        results['vulnerabilities'] = vulnerabilities
+        
+        # Une vérification en échec ne compte pas comme réussie: score nul
+        if failed:
+            results['score'] = 0.0
+            return results
+        
+        # Calcul du score: chaque vulnérabilité critique pèse davantage
+        critical = sum(1 for v in vulnerabilities if v.get('severity') == 'critical')
+        results['score'] = max(
+            0.0,
+            1.0 - (critical * CRITICAL_PENALTY + len(vulnerabilities) * VULNERABILITY_PENALTY)
+        )
         
         return results
         
@@ -129,6 +139,10 @@ async def main():
         # Parse des arguments
         args = parse_args()
         
+        # Dossier du rapport créé une seule fois, avant l'audit
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        
         # Initialisation des gestionnaires
         security_manager = SecurityManager()
         alert_manager = AlertManager()
@@ -148,18 +162,17 @@ async def main():
         # Envoi des alertes si nécessaire
         if results['score'] < 0.7:
             await alert_manager.send_telegram_alert(
-                os.getenv('TELEGRAM_ADMIN_ID'),
                 f"⚠️ Score de sécurité faible: {results['score']:.2f}\n"
                 f"Vulnérabilités trouvées: {len(results['vulnerabilities'])}\n"
-                f"Corrections appliquées: {len(results['fixes_applied'])}"
+                f"Corrections appliquées: {len(results['fixes_applied'])}",
+                chat_id=os.getenv('TELEGRAM_ADMIN_ID')
             )
             
         # Sauvegarde du rapport
-        os.makedirs(os.path.dirname(args.output), exist_ok=True)
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=4)
+        with open(output, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
             
-        logger.info(f"Rapport sauvegardé dans {args.output}")
+        logger.info(f"Rapport sauvegardé dans {output}")
         
         # Affichage du résumé
         print("\nRésumé de l'audit de sécurité:")
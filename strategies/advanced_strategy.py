@@ -1,38 +1,53 @@
 import talib
+import numpy as np
 import pandas as pd
 import logging
+from utils._njit import NUMBA_AVAILABLE
+from utils.indicator_kernels import advanced_signals
 
 logger = logging.getLogger(__name__)
 
-def advanced_strategy(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+def advanced_strategy(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
     """
     Stratégie avancée utilisant EMA, RSI et MACD.
     
+    Les indicateurs sont calculés directement sur le tableau NumPy des clôtures,
+    sans colonnes intermédiaires: le DataFrame d'entrée (pandas ou Polars)
+    n'est pas modifié. Avec Numba, un kernel fusionné calcule les EMA, le MACD,
+    le RSI et les signaux en un seul passage; sinon TA-Lib est utilisé.
+    
     Args:
-        df (pd.DataFrame): DataFrame contenant les données OHLCV
+        df (pd.DataFrame): DataFrame contenant les données OHLCV (pandas ou Polars)
         
     Returns:
-        tuple[pd.Series, pd.Series]: Signaux d'achat et de vente
+        tuple[np.ndarray, np.ndarray]: Signaux d'achat et de vente
     """
     try:
+        close = np.ascontiguousarray(df['close'].to_numpy(), dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            buy_signal, sell_signal = advanced_signals(close)
+            logger.info("Stratégie avancée calculée avec succès")
+            return buy_signal, sell_signal
+        
         # Calcul des indicateurs techniques
-        df['EMA_20'] = talib.EMA(df['close'], timeperiod=20)
-        df['EMA_50'] = talib.EMA(df['close'], timeperiod=50)
-        df['RSI'] = talib.RSI(df['close'], timeperiod=14)
-        df['MACD'], df['MACD_Signal'], _ = talib.MACD(df['close'])
+        ema_20 = talib.EMA(close, timeperiod=20)
+        ema_50 = talib.EMA(close, timeperiod=50)
+        rsi = talib.RSI(close, timeperiod=14)
+        macd, macd_signal, _ = talib.MACD(close)
         
         # Conditions d'achat
         buy_signal = (
-            (df['EMA_20'] > df['EMA_50']) &  # Croisement haussier des EMA
-            (df['RSI'] < 30) &                 # Survente
-            (df['MACD'] > df['MACD_Signal'])  # Croisement haussier du MACD
+            (ema_20 > ema_50) &  # Croisement haussier des EMA
+            (rsi < 30) &           # Survente
+            (macd > macd_signal)   # Croisement haussier du MACD
         )
         
         # Conditions de vente
         sell_signal = (
-            (df['EMA_20'] < df['EMA_50']) &  # Croisement baissier des EMA
-            (df['RSI'] > 70) &                # Surachat
-            (df['MACD'] < df['MACD_Signal']) # Croisement baissier du MACD
+            (ema_20 < ema_50) &  # Croisement baissier des EMA
+            (rsi > 70) &           # Surachat
+            (macd < macd_signal)   # Croisement baissier du MACD
         )
         
         logger.info("Stratégie avancée calculée avec succès")
@@ -40,4 +55,4 @@ def advanced_strategy(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
         
     except Exception as e:
         logger.error(f"Erreur lors du calcul de la stratégie avancée: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
@@ -1,6 +1,7 @@
 import os
 import logging
 import asyncio
+from functools import lru_cache
 from vercel import Request, Response
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, ContextTypes
@@ -10,6 +11,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Token lu et validé une seule fois, au chargement du module
+TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
+if not TELEGRAM_TOKEN:
+    raise ValueError("TELEGRAM_TOKEN not found in environment variables")
+
 # Configuration du logging détaillé
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -33,15 +39,23 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def balance(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Affiche les soldes du compte"""
-    balances = crypto_bot.get_account_balance()
+    # Appel Binance bloquant exécuté hors de la boucle d'événements
+    balances = await asyncio.to_thread(crypto_bot.get_account_balance)
     if balances:
-        message = "💰 Vos soldes:\n\n"
-        for balance in balances:
-            if float(balance['free']) > 0 or float(balance['locked']) > 0:
-                message += f"🔸 {balance['asset']}:\n"
-                message += f"   Disponible: {balance['free']}\n"
-                message += f"   Bloqué: {balance['locked']}\n"
-        await update.message.reply_text(message)
+        # Filtrage des soldes nuls en un seul passage, avant le formatage
+        nonzero = [
+            (b['asset'], b['free'], b['locked'])
+            for b in balances
+            if float(b['free']) > 0 or float(b['locked']) > 0
+        ]
+        parts = ["💰 Vos soldes:\n\n"]
+        parts.extend(
+            f"🔸 {asset}:\n"
+            f"   Disponible: {free}\n"
+            f"   Bloqué: {locked}\n"
+            for asset, free, locked in nonzero
+        )
+        await update.message.reply_text("".join(parts))
     else:
         await update.message.reply_text("❌ Erreur lors de la récupération des soldes")
 
@@ -52,7 +66,7 @@ async def price(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     symbol = context.args[0].upper()
-    market_data = crypto_bot.get_market_data(symbol=symbol, limit=1)
+    market_data = await asyncio.to_thread(crypto_bot.get_market_data, symbol=symbol, limit=1)
     
     if market_data is not None and not market_data.empty:
         last_price = market_data.iloc[-1]['close']
@@ -64,12 +78,12 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Affiche l'état du bot"""
     status_message = (
         "📊 État du Bot:\n\n"
-        f"Symbol par défaut: {TRADING_CONFIG['default_symbol']}\n"
-        f"Interval: {TRADING_CONFIG['default_interval']}\n"
-        f"Trades max/jour: {TRADING_CONFIG['max_trades_per_day']}\n"
-        f"Risk par trade: {TRADING_CONFIG['risk_percentage']}%\n"
-        f"Stop Loss: {TRADING_CONFIG['stop_loss_percentage']}%\n"
-        f"Take Profit: {TRADING_CONFIG['take_profit_percentage']}%"
+        f"Symbol par défaut: {TRADING_CONFIG.default_symbol}\n"
+        f"Interval: {TRADING_CONFIG.default_interval}\n"
+        f"Trades max/jour: {TRADING_CONFIG.max_trades_per_day}\n"
+        f"Risk par trade: {TRADING_CONFIG.risk_percentage}%\n"
+        f"Stop Loss: {TRADING_CONFIG.stop_loss_percentage}%\n"
+        f"Take Profit: {TRADING_CONFIG.take_profit_percentage}%"
     )
     await update.message.reply_text(status_message)
 
@@ -103,21 +117,70 @@ async def trade(update: Update, context: ContextTypes.DEFAULT_TYPE):
     result = crypto_bot.execute_trade()
     await update.message.reply_text(f"💰 Résultat du trade:\n{result}")
 
+# Intervalle (secondes) du message de statut en mode local
+STATUS_INTERVAL = 10
+
+def build_application(token: str) -> Application:
+    """
+    Construit l'Application Telegram et enregistre les commandes.
+    
+    Args:
+        token (str): Token du bot Telegram
+        
+    Returns:
+        Application: Application prête à traiter les mises à jour
+    """
+    app = Application.builder().token(token).build()
+    app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("help", help_command))
+    app.add_handler(CommandHandler("status", status))
+    app.add_handler(CommandHandler("settings", settings))
+    app.add_handler(CommandHandler("trade", trade))
+    return app
+
+def run_polling():
+    """
+    Lance le bot en mode local (polling).
+    
+    Le message de statut est planifié sur la job_queue de l'Application:
+    les envois partagent le client HTTP et la boucle d'événements du polling
+    au lieu d'une boucle bloquante avec time.sleep().
+    """
+    app = build_application(TELEGRAM_TOKEN)
+    app.job_queue.run_repeating(send_status_message, interval=STATUS_INTERVAL, first=1)
+    app.run_polling(allowed_updates=Update.ALL_TYPES)
+
+@lru_cache(maxsize=1)
+def _get_app() -> Application:
+    """
+    Application du mode webhook, construite une seule fois par processus.
+    
+    Returns:
+        Application: Application partagée entre les requêtes
+    """
+    return build_application(TELEGRAM_TOKEN)
+
+@lru_cache(maxsize=1)
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Boucle d'événements conservée entre les requêtes: le client HTTP du bot
+    y reste attaché, contrairement à asyncio.run() qui en crée une à chaque appel.
+    
+    Returns:
+        asyncio.AbstractEventLoop: Boucle du processus
+    """
+    return asyncio.new_event_loop()
+
+_app_initialized = False
+
 async def webhook_handler(request):
     """Handle incoming webhook requests from Telegram."""
+    global _app_initialized
     try:
-        TOKEN = os.getenv('TELEGRAM_TOKEN')
-        if not TOKEN:
-            raise ValueError("TELEGRAM_TOKEN not found in environment variables")
-
-        app = Application.builder().token(TOKEN).build()
-        
-        # Add handlers
-        app.add_handler(CommandHandler("start", start))
-        app.add_handler(CommandHandler("help", help_command))
-        app.add_handler(CommandHandler("status", status))
-        app.add_handler(CommandHandler("settings", settings))
-        app.add_handler(CommandHandler("trade", trade))
+        app = _get_app()
+        if not _app_initialized:
+            await app.initialize()
+            _app_initialized = True
 
         # Process update
         update = Update.de_json(await request.json(), app.bot)
@@ -135,7 +198,7 @@ def main(request: Request) -> Response:
         logger.info(f"Méthode de la requête: {request.method}")
         logger.info(f"Corps de la requête: {request.json()}")
         
-        result = asyncio.run(webhook_handler(request))
+        result = _get_loop().run_until_complete(webhook_handler(request))
         logger.info(f"Résultat du traitement: {result}")
         
         return Response.json({"status": "success", "result": result})
@@ -146,4 +209,4 @@ def main(request: Request) -> Response:
 if __name__ == '__main__':
     # En mode local, utiliser le polling
     logger.info("Démarrage du bot Telegram en mode local")
-    main() 
\ No newline at end of file
+    run_polling() 
\ No newline at end of file
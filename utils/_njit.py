@@ -0,0 +1,23 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba non installé: les kernels s'exécutent en Python pur")
+
+    def njit(*args, **kwargs):
+        """
+        Remplace numba.njit par un décorateur neutre.
+        
+        Accepte les deux formes d'appel (@njit et @njit(cache=True, ...)).
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    # Sans Numba, les boucles parallèles s'exécutent séquentiellement
+    prange = range
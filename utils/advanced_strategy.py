@@ -3,9 +3,14 @@ import numpy as np
 import pandas as pd
 import talib
 from typing import Dict, Any, Tuple
+from utils.indicator_cache import IndicatorCache
 
 logger = logging.getLogger(__name__)
 
+# Indicateurs mémoïsés par sous-ensemble de paramètres: lors d'une optimisation,
+# un changement de bb_period ne recalcule ni les EMA, ni le MACD, ni le RSI
+_indicator_cache = IndicatorCache(maxsize=512)
+
 class AdvancedStrategy:
     """
     Stratégie de trading avancée utilisant plusieurs indicateurs techniques.
@@ -64,25 +69,38 @@ class AdvancedStrategy:
             pd.DataFrame: DataFrame avec les indicateurs ajoutés
         """
         try:
+            data_key = IndicatorCache.fingerprint(df, ('high', 'low', 'close'))
+            cached = _indicator_cache.get_or_compute
+            
             # Indicateurs de base
-            df['EMA_20'] = talib.EMA(df['close'], self.ema_short)
-            df['EMA_50'] = talib.EMA(df['close'], self.ema_long)
+            df['EMA_20'] = cached((data_key, 'EMA', self.ema_short),
+                                  lambda: talib.EMA(df['close'], self.ema_short))
+            df['EMA_50'] = cached((data_key, 'EMA', self.ema_long),
+                                  lambda: talib.EMA(df['close'], self.ema_long))
             
             # Indicateurs avancés
-            df['ATR'] = talib.ATR(df['high'], df['low'], df['close'], self.atr_period)
-            df['MACD'], df['MACD_SIGNAL'], df['MACD_HIST'] = talib.MACD(
-                df['close'],
-                fastperiod=self.macd_fast,
-                slowperiod=self.macd_slow,
-                signalperiod=self.macd_signal
+            df['ATR'] = cached((data_key, 'ATR', self.atr_period),
+                               lambda: talib.ATR(df['high'], df['low'], df['close'], self.atr_period))
+            df['MACD'], df['MACD_SIGNAL'], df['MACD_HIST'] = cached(
+                (data_key, 'MACD', self.macd_fast, self.macd_slow, self.macd_signal),
+                lambda: talib.MACD(
+                    df['close'],
+                    fastperiod=self.macd_fast,
+                    slowperiod=self.macd_slow,
+                    signalperiod=self.macd_signal
+                )
             )
-            df['BOLLINGER_UP'], df['BOLLINGER_MID'], df['BOLLINGER_LOW'] = talib.BBANDS(
-                df['close'],
-                timeperiod=self.bb_period,
-                nbdevup=self.bb_std,
-                nbdevdn=self.bb_std
+            df['BOLLINGER_UP'], df['BOLLINGER_MID'], df['BOLLINGER_LOW'] = cached(
+                (data_key, 'BBANDS', self.bb_period, self.bb_std),
+                lambda: talib.BBANDS(
+                    df['close'],
+                    timeperiod=self.bb_period,
+                    nbdevup=self.bb_std,
+                    nbdevdn=self.bb_std
+                )
             )
-            df['RSI'] = talib.RSI(df['close'], timeperiod=self.rsi_period)
+            df['RSI'] = cached((data_key, 'RSI', self.rsi_period),
+                               lambda: talib.RSI(df['close'], timeperiod=self.rsi_period))
             
             return df
             
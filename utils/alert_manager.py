@@ -12,6 +12,14 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 vers l'API Telegram si h2 est installé : les alertes successives
+# sont multiplexées sur une seule session TLS
+try:
+    import h2  # noqa: F401
+    TELEGRAM_HTTP_VERSION = "2"
+except ImportError:
+    TELEGRAM_HTTP_VERSION = "1.1"
+
 class AlertManager:
     """
     Gestionnaire d'alertes pour le bot de trading.
@@ -46,25 +54,32 @@ class AlertManager:
         
         # Initialisation de l'application Telegram
         if self.telegram_token:
-            self.telegram_app = ApplicationBuilder().token(self.telegram_token).build()
+            self.telegram_app = (
+                ApplicationBuilder()
+                .token(self.telegram_token)
+                .http_version(TELEGRAM_HTTP_VERSION)
+                .build()
+            )
             
-    async def send_telegram_alert(self, message: str) -> bool:
+    async def send_telegram_alert(self, message: str, chat_id: Optional[str] = None) -> bool:
         """
         Envoie une alerte via Telegram.
         
         Args:
             message (str): Message à envoyer
+            chat_id (Optional[str]): Destinataire, chat configuré par défaut
             
         Returns:
             bool: True si l'envoi est réussi
         """
         try:
-            if not self.telegram_token or not self.telegram_chat_id:
+            chat_id = chat_id or self.telegram_chat_id
+            if not self.telegram_token or not chat_id:
                 logger.warning("Configuration Telegram manquante")
                 return False
                 
             await self.telegram_app.bot.send_message(
-                chat_id=self.telegram_chat_id,
+                chat_id=chat_id,
                 text=message,
                 parse_mode='Markdown'
             )
@@ -0,0 +1,185 @@
+import numpy as np
+from typing import Tuple
+from utils._njit import njit, prange
+
+@njit(cache=True)
+def simulate(close: np.ndarray, atr: np.ndarray, entries: np.ndarray, equity0: float,
+             atr_multiplier: float, risk_reward_ratio: float,
+             risk_fraction: float) -> Tuple[np.ndarray, ...]:
+    """
+    Simule les entrées/sorties d'un backtest long-only avec stop-loss ATR.
+    
+    Reprend en arithmétique scalaire le calcul de RiskManager.analyze_trade_setup
+    (calculate_dynamic_stop_loss, calculate_take_profit, calculate_position_size
+    avec une fraction de Kelly), Numba ne pouvant pas appeler les méthodes du
+    gestionnaire de risque. Hors position, la
+    boucle saute directement au signal d'achat suivant au lieu de parcourir
+    chaque barre.
+    
+    Args:
+        close (np.ndarray): Prix de clôture (float64)
+        atr (np.ndarray): ATR (float64)
+        entries (np.ndarray): Indices des barres avec signal d'achat (int64, croissants)
+        equity0 (float): Capital initial
+        atr_multiplier (float): Multiplicateur de l'ATR pour le stop-loss
+        risk_reward_ratio (float): Ratio risque/récompense du take-profit
+        risk_fraction (float): Fraction du capital risquée par trade (critère de Kelly)
+        
+    Returns:
+        Tuple[np.ndarray, ...]: (indices, sorties, prix, pnl, equity,
+        stop_loss, take_profit, taille) tronqués au nombre d'événements
+    """
+    n = close.shape[0]
+    
+    # Au plus une entrée et une sortie par signal d'achat
+    capacity = 2 * entries.shape[0]
+    idx = np.empty(capacity, dtype=np.int64)
+    is_exit = np.empty(capacity, dtype=np.bool_)
+    price = np.empty(capacity, dtype=np.float64)
+    pnl = np.empty(capacity, dtype=np.float64)
+    equity_curve = np.empty(capacity, dtype=np.float64)
+    stop_losses = np.empty(capacity, dtype=np.float64)
+    take_profits = np.empty(capacity, dtype=np.float64)
+    size = np.empty(capacity, dtype=np.float64)
+    
+    count = 0
+    equity = equity0
+    next_free = 0  # Première barre où une entrée est possible
+    for k in range(entries.shape[0]):
+        i = entries[k]
+        if i < next_free:
+            continue
+        
+        # Entrée en position
+        entry_price = close[i]
+        stop_loss = entry_price - atr_multiplier * atr[i]
+        risk_per_unit = entry_price - stop_loss
+        position = equity * risk_fraction / risk_per_unit if risk_per_unit > 0 else 0.0
+        idx[count] = i
+        is_exit[count] = False
+        price[count] = entry_price
+        pnl[count] = 0.0
+        equity_curve[count] = equity
+        stop_losses[count] = stop_loss
+        take_profits[count] = entry_price + risk_per_unit * risk_reward_ratio
+        size[count] = position
+        count += 1
+        
+        if not position > 0:
+            next_free = i + 1
+            continue
+        
+        # Recherche de la barre de stop-loss
+        j = i + 1
+        while j < n and not close[j] <= stop_loss:
+            j += 1
+        if j == n:
+            # Position toujours ouverte en fin de données
+            break
+        
+        trade_pnl = (close[j] - entry_price) * position
+        equity += trade_pnl
+        idx[count] = j
+        is_exit[count] = True
+        price[count] = close[j]
+        pnl[count] = trade_pnl
+        equity_curve[count] = equity
+        stop_losses[count] = np.nan
+        take_profits[count] = np.nan
+        size[count] = np.nan
+        count += 1
+        
+        # Pas de nouvelle entrée sur la barre de sortie
+        next_free = j + 1
+    
+    return (idx[:count], is_exit[:count], price[:count], pnl[:count],
+            equity_curve[:count], stop_losses[:count], take_profits[:count], size[:count])
+
+@njit(cache=True)
+def rsi_reversal_trades(close: np.ndarray, rsi: np.ndarray, rsi_oversold: float,
+                        rsi_overbought: float, take_profit: float,
+                        stop_loss: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simule la stratégie de retournement RSI et retourne le journal des trades.
+    
+    Achat sous le seuil de survente, vente au-dessus du seuil de surachat,
+    clôture dès que le rendement atteint le take-profit ou le stop-loss. Pas
+    de nouvelle entrée sur la barre de sortie; une position encore ouverte en
+    fin de données n'est pas comptée.
+    
+    Args:
+        close (np.ndarray): Prix de clôture (float64)
+        rsi (np.ndarray): RSI (float64, NaN pendant la période de chauffe)
+        rsi_oversold (float): Seuil de survente
+        rsi_overbought (float): Seuil de surachat
+        take_profit (float): Rendement de clôture gagnante
+        stop_loss (float): Perte de clôture (valeur positive)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (indices d'entrée, indices
+        de sortie, PnL relatif) des trades clôturés, tableaux parallèles
+    """
+    n = close.shape[0]
+    
+    # Un trade occupe au moins deux barres
+    capacity = n // 2 + 1
+    entry_idx = np.empty(capacity, dtype=np.int64)
+    exit_idx = np.empty(capacity, dtype=np.int64)
+    pnls = np.empty(capacity, dtype=np.float64)
+    
+    count = 0
+    position = 0.0
+    entry = 0
+    entry_price = 0.0
+    # Parcours conjoint des deux tableaux plutôt qu'indexation barre par barre
+    # (plus rapide dans le repli Python pur, identique une fois compilé)
+    for i, (price, rsi_value) in enumerate(zip(close, rsi)):
+        if position == 0.0:
+            if rsi_value < rsi_oversold:
+                position = 1.0
+            elif rsi_value > rsi_overbought:
+                position = -1.0
+            else:
+                continue
+            entry = i
+            entry_price = price
+        else:
+            pnl = (price - entry_price) / entry_price * position
+            if pnl >= take_profit or pnl <= -stop_loss:
+                entry_idx[count] = entry
+                exit_idx[count] = i
+                pnls[count] = pnl
+                count += 1
+                position = 0.0
+    
+    return entry_idx[:count], exit_idx[:count], pnls[:count]
+
+@njit(cache=True, parallel=True)
+def rsi_reversal_sweep(close: np.ndarray, rsi: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Évalue une grille de paramètres de la stratégie RSI en parallèle.
+    
+    Chaque ligne de la grille est un backtest indépendant qui n'écrit que
+    son propre score, ce qui permet de répartir les lignes sur les cœurs.
+    
+    Args:
+        close (np.ndarray): Prix de clôture (float64)
+        rsi (np.ndarray): RSI (float64)
+        params (np.ndarray): Grille (n, 4): survente, surachat, take-profit, stop-loss
+        
+    Returns:
+        np.ndarray: Ratio de Sharpe annualisé de chaque ligne (-inf si moins de deux trades)
+    """
+    scores = np.empty(params.shape[0], dtype=np.float64)
+    for k in prange(params.shape[0]):
+        pnls = rsi_reversal_trades(close, rsi, params[k, 0], params[k, 1],
+                                   params[k, 2], params[k, 3])[2]
+        m = pnls.shape[0]
+        if m < 2:
+            scores[k] = -np.inf
+            continue
+        mean = pnls.mean()
+        std = np.sqrt(((pnls - mean) ** 2).sum() / (m - 1))
+        scores[k] = np.sqrt(252.0) * mean / std if std > 0 else 0.0
+    
+    return scores
@@ -0,0 +1,69 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Sequence
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class IndicatorCache:
+    """
+    Cache LRU en mémoire des indicateurs techniques.
+    
+    Les entrées sont indexées par l'empreinte des données et les paramètres
+    de l'indicateur, ce qui évite de recalculer les mêmes indicateurs entre
+    deux backtests d'une optimisation.
+    """
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialise le cache.
+        
+        Args:
+            maxsize (int): Nombre maximal d'entrées conservées
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+    
+    @staticmethod
+    def fingerprint(df: pd.DataFrame, columns: Sequence[str] = ('close',)) -> str:
+        """
+        Calcule l'empreinte des données utilisées par les indicateurs.
+        
+        Args:
+            df (pd.DataFrame): Données OHLCV
+            columns (Sequence[str]): Colonnes entrant dans le calcul
+        
+        Returns:
+            str: Empreinte hexadécimale de l'index et des colonnes
+        """
+        digest = hashlib.blake2b(df.index.values.tobytes(), digest_size=16)
+        for column in columns:
+            digest.update(df[column].to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne la valeur en cache ou la calcule puis la stocke.
+        
+        Args:
+            key (Hashable): Clé (empreinte, indicateur, paramètres)
+            compute (Callable[[], Any]): Calcul à effectuer en cas d'absence
+        
+        Returns:
+            Any: Valeur de l'indicateur
+        """
+        try:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        except KeyError:
+            value = compute()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+    
+    def clear(self) -> None:
+        """
+        Vide le cache.
+        """
+        self._entries.clear()
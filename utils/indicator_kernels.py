@@ -0,0 +1,177 @@
+import numpy as np
+from utils._njit import njit
+
+@njit(cache=True)
+def ewma(x: np.ndarray, alpha: float, out: np.ndarray) -> np.ndarray:
+    """
+    Moyenne mobile exponentielle récursive, équivalente à ewm(adjust=False).mean().
+    
+    Args:
+        x (np.ndarray): Série d'entrée (float64)
+        alpha (float): Facteur de lissage (2 / (span + 1) pour une EMA)
+        out (np.ndarray): Tampon de sortie de même taille que x
+        
+    Returns:
+        np.ndarray: Le tampon out rempli
+    """
+    if x.shape[0] == 0:
+        return out
+    out[0] = x[0]
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+@njit(cache=True)
+def wilder_rsi(prices: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """
+    RSI de Wilder calculé en un seul passage sur les prix.
+    
+    Les moyennes des hausses et des baisses sont amorcées par la moyenne
+    simple des `period` premières variations, puis lissées par la récurrence
+    de Wilder (alpha = 1 / period). Les `period` premières valeurs sont NaN.
+    
+    Args:
+        prices (np.ndarray): Prix de clôture (float64)
+        period (int): Période du RSI
+        out (np.ndarray): Tampon de sortie de même taille que prices
+        
+    Returns:
+        np.ndarray: Le tampon out rempli
+    """
+    n = prices.shape[0]
+    out[:min(period, n)] = np.nan
+    if n <= period:
+        return out
+    
+    # Amorçage: moyenne simple des premières variations
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = prices[i] - prices[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    
+    i = period
+    while True:
+        out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+        i += 1
+        if i >= n:
+            break
+        d = prices[i] - prices[i - 1]
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+    
+    return out
+
+@njit(cache=True)
+def advanced_signals(close: np.ndarray, rsi_oversold: float = 30.0,
+                     rsi_overbought: float = 70.0) -> tuple:
+    """
+    Signaux EMA20/EMA50, RSI(14) et MACD(12, 26, 9) calculés en un seul passage.
+    
+    Les quatre récurrences EMA (20, 50, 12, 26), la ligne de signal du MACD
+    et le lissage de Wilder du RSI sont mis à jour ensemble à chaque prix,
+    au lieu d'un parcours complet de `close` par indicateur. Les amorçages
+    reproduisent ceux de TA-Lib (moyenne simple sur la première période, EMA
+    rapide du MACD alignée sur la lente): les séries sont identiques à celles
+    de talib.EMA/RSI/MACD. Aucun signal n'est émis avant la première valeur
+    de l'EMA50.
+    
+    Args:
+        close (np.ndarray): Prix de clôture (float64, contigu)
+        rsi_oversold (float): Seuil de survente du RSI
+        rsi_overbought (float): Seuil de surachat du RSI
+        
+    Returns:
+        tuple: Signaux d'achat et de vente (tableaux booléens)
+    """
+    n = close.shape[0]
+    buy = np.zeros(n, dtype=np.bool_)
+    sell = np.zeros(n, dtype=np.bool_)
+    
+    k20 = 2.0 / 21.0
+    k50 = 2.0 / 51.0
+    k12 = 2.0 / 13.0
+    k26 = 2.0 / 27.0
+    k9 = 2.0 / 10.0
+    rsi_period = 14
+    
+    # Indices de première valeur, comme les lookbacks de TA-Lib
+    macd_start = 25           # EMA lente du MACD
+    fast_start = 26 - 12      # début de l'amorçage de l'EMA rapide
+    signal_start = 25 + 8     # ligne de signal
+    warmup = 49               # EMA50
+    
+    ema20 = ema50 = ema12 = ema26 = macd_signal = 0.0
+    gain = loss = 0.0
+    
+    for i in range(n):
+        price = close[i]
+        
+        # EMA: moyenne simple jusqu'à la fin de la première période, puis récurrence
+        if i < 20:
+            ema20 += price
+            if i == 19:
+                ema20 /= 20
+        else:
+            ema20 = (price - ema20) * k20 + ema20
+        if i < 50:
+            ema50 += price
+            if i == 49:
+                ema50 /= 50
+        else:
+            ema50 = (price - ema50) * k50 + ema50
+        if i < 26:
+            ema26 += price
+            if i == 25:
+                ema26 /= 26
+        else:
+            ema26 = (price - ema26) * k26 + ema26
+        if i < 26:
+            if i >= fast_start:
+                ema12 += price
+                if i == 25:
+                    ema12 /= 12
+        else:
+            ema12 = (price - ema12) * k12 + ema12
+            
+        # MACD et ligne de signal (EMA9 amorcée sur les 9 premières valeurs du MACD)
+        macd = ema12 - ema26
+        if i >= macd_start:
+            if i <= signal_start:
+                macd_signal += macd
+                if i == signal_start:
+                    macd_signal /= 9
+            else:
+                macd_signal = (macd - macd_signal) * k9 + macd_signal
+                
+        # RSI de Wilder: moyenne simple puis lissage incrémental
+        if i > 0:
+            d = price - close[i - 1]
+            g = d if d > 0 else 0.0
+            l = -d if d < 0 else 0.0
+            if i <= rsi_period:
+                gain += g
+                loss += l
+                if i == rsi_period:
+                    gain /= rsi_period
+                    loss /= rsi_period
+            else:
+                gain = (gain * (rsi_period - 1) + g) / rsi_period
+                loss = (loss * (rsi_period - 1) + l) / rsi_period
+                
+        if i < warmup:
+            continue
+        total = gain + loss
+        rsi = 100.0 * (gain / total) if total != 0.0 else 0.0
+        
+        buy[i] = ema20 > ema50 and rsi < rsi_oversold and macd > macd_signal
+        sell[i] = ema20 < ema50 and rsi > rsi_overbought and macd < macd_signal
+        
+    return buy, sell
@@ -1,18 +1,27 @@
 import os
-import json
+import orjson
 import logging
 import base64
 from typing import Dict, Any, Optional, Union
 from datetime import datetime, timedelta
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.backends import default_backend
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Taille du nonce AES-GCM (96 bits)
+NONCE_SIZE = 12
+
+# Contexte HKDF de la clé AES-GCM, distincte de la clé Fernet
+AESGCM_KEY_INFO = b"aes-gcm"
+
 class SecurityManager:
     """
     Gestionnaire de sécurité pour le chiffrement et la protection des données sensibles.
@@ -34,6 +43,7 @@ class SecurityManager:
         self.encrypted_file = encrypted_file
         self.key = None
         self.cipher = None
+        self._legacy_cipher = None
         self._initialize_encryption()
         
     def _initialize_encryption(self):
@@ -53,12 +63,30 @@ class SecurityManager:
                 with open(self.key_file, 'wb') as f:
                     f.write(self.key)
                     
-            self.cipher = Fernet(self.key)
+            self._set_ciphers()
             
         except Exception as e:
             logger.error(f"Erreur lors de l'initialisation du chiffrement: {str(e)}")
             raise
             
+    def _set_ciphers(self):
+        """
+        Crée les chiffreurs à partir de la clé courante.
+        
+        La clé reste au format Fernet (32 octets en base64). La clé AES-256-GCM
+        en est dérivée par HKDF (info "aes-gcm") pour ne pas réutiliser les
+        mêmes octets que Fernet, conservé uniquement pour déchiffrer les
+        données produites avant le passage à AES-GCM.
+        """
+        aes_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=AESGCM_KEY_INFO
+        ).derive(base64.urlsafe_b64decode(self.key))
+        self.cipher = AESGCM(aes_key)
+        self._legacy_cipher = Fernet(self.key)
+        
     def encrypt_data(self, data: str) -> str:
         """
         Chiffre une chaîne de caractères.
@@ -67,10 +95,11 @@ class SecurityManager:
             data (str): Données à chiffrer
             
         Returns:
-            str: Données chiffrées en base64
+            str: Données chiffrées en base64 (nonce || chiffré || tag)
         """
         try:
-            encrypted_data = self.cipher.encrypt(data.encode())
+            nonce = os.urandom(NONCE_SIZE)
+            encrypted_data = nonce + self.cipher.encrypt(nonce, data.encode(), None)
             return base64.b64encode(encrypted_data).decode()
         except Exception as e:
             logger.error(f"Erreur lors du chiffrement des données: {str(e)}")
@@ -88,7 +117,16 @@ class SecurityManager:
         """
         try:
             decoded_data = base64.b64decode(encrypted_data.encode())
-            decrypted_data = self.cipher.decrypt(decoded_data)
+            try:
+                decrypted_data = self.cipher.decrypt(
+                    decoded_data[:NONCE_SIZE], decoded_data[NONCE_SIZE:], None
+                )
+            except InvalidTag:
+                # Données chiffrées avant le passage à AES-GCM
+                try:
+                    decrypted_data = self._legacy_cipher.decrypt(decoded_data)
+                except InvalidToken:
+                    raise ValueError("Données chiffrées invalides ou clé incorrecte")
             return decrypted_data.decode()
         except Exception as e:
             logger.error(f"Erreur lors du déchiffrement des données: {str(e)}")
@@ -179,8 +217,8 @@ class SecurityManager:
                             encrypted_vars[key] = value
                             
             # Sauvegarde des variables chiffrées
-            with open(self.encrypted_file, 'w') as f:
-                json.dump(encrypted_vars, f, indent=4)
+            with open(self.encrypted_file, 'wb') as f:
+                f.write(orjson.dumps(encrypted_vars, option=orjson.OPT_INDENT_2))
                 
             logger.info(f"Variables d'environnement sécurisées sauvegardées dans {self.encrypted_file}")
             
@@ -197,8 +235,8 @@ class SecurityManager:
                 logger.warning(f"Le fichier {self.encrypted_file} n'existe pas")
                 return
                 
-            with open(self.encrypted_file, 'r') as f:
-                encrypted_vars = json.load(f)
+            with open(self.encrypted_file, 'rb') as f:
+                encrypted_vars = orjson.loads(f.read())
                 
             for key, value in encrypted_vars.items():
                 if any(sk in key.lower() for sk in ['key', 'secret', 'token', 'password']):
@@ -231,7 +269,7 @@ class SecurityManager:
                 
             # Mise à jour du chiffreur
             self.key = new_key
-            self.cipher = Fernet(self.key)
+            self._set_ciphers()
             
             logger.info("Clé de chiffrement rotée avec succès")
             